@@ -0,0 +1,54 @@
+"""
+Time of decoding enum values from API responses:
+the precomputed _decode_map_ lookup of _EnumMeta against the name normalization it replaced.
+
+$ python benchmarks/enum_decoding.py
+"""
+from enum import EnumMeta
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import plisio  # noqa: E402
+
+
+NUMBER = 200000
+
+CASES = [
+    (plisio.CryptoCurrency, 'BTC'),
+    (plisio.CryptoCurrency, 'USDT-TRX'),
+    (plisio.OperationStatus, '111'),
+    (plisio.OperationStatus, 'cancelled duplicate'),
+]
+
+
+def normalized(enum_class, item):
+    """
+    __getitem__ of _EnumMeta before _decode_map_
+    """
+    key = item.replace('-', '_').replace(' ', '_')
+    if key not in enum_class._member_map_:
+        key = '_' + key
+    return EnumMeta.__getitem__(enum_class, key)
+
+
+def ns_per_call(function) -> float:
+    return min(timeit.repeat(function, number=NUMBER, repeat=5)) / NUMBER * 1e9
+
+
+def main():
+    print(f'{"value":<40}{"normalized, ns":>16}{"decode map, ns":>16}')
+    for enum_class, item in CASES:
+        assert normalized(enum_class, item) is enum_class[item]
+        print(
+            f'{enum_class.__name__ + "[" + repr(item) + "]":<40}'
+            f'{ns_per_call(lambda: normalized(enum_class, item)):>16.0f}'
+            f'{ns_per_call(lambda: enum_class[item]):>16.0f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
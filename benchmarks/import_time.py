@@ -0,0 +1,70 @@
+"""
+Time of importing plisio, measured by python -X importtime in fresh interpreters:
+the import alone, which leaves requests and aiohttp unloaded, against the import with the first use of the sync transport.
+
+$ python benchmarks/import_time.py
+"""
+from typing import Dict, Tuple
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+
+RUNS = 5
+TOP = 10
+
+CASES = [
+    ('import plisio', 'import plisio'),
+    ('import plisio, use the sync transport', 'import plisio; plisio.PlisioClient("key").transport.session'),
+]
+
+
+def import_times(code: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Self and cumulative microseconds of every module imported by the code
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=ROOT,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        times[module.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def best_times(code: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Lowest times of each module over RUNS interpreters
+    """
+    best = {}
+    for _ in range(RUNS):
+        for module, (self_us, cumulative_us) in import_times(code).items():
+            previous = best.get(module, (self_us, cumulative_us))
+            best[module] = (min(previous[0], self_us), min(previous[1], cumulative_us))
+    return best
+
+
+def main():
+    for title, code in CASES:
+        times = best_times(code)
+        loaded = [
+            f'{name} {times[name][1] / 1000:.1f} ms' for name in ('requests', 'aiohttp', 'httpx') if name in times
+        ]
+        print(f'{title}: plisio {times["plisio"][1] / 1000:.1f} ms, HTTP clients: {", ".join(loaded) or "not loaded"}')
+        print(f'  {"module":<40}{"self, ms":>12}{"cumulative, ms":>16}')
+        for module, (self_us, cumulative_us) in sorted(times.items(), key=lambda item: -item[1][0])[:TOP]:
+            print(f'  {module:<40}{self_us / 1000:>12.2f}{cumulative_us / 1000:>16.2f}')
+        print()
+
+
+if __name__ == '__main__':
+    main()
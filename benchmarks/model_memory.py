@@ -0,0 +1,71 @@
+"""
+Memory of decoded operations: the slotted models against the same classes with a __dict__.
+
+$ python benchmarks/model_memory.py
+"""
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import plisio  # noqa: E402
+
+
+COUNT = 100000
+
+RESPONSE = {
+    'user_id': '1',
+    'shop_id': 'shop',
+    'type': 'invoice',
+    'status': 'completed',
+    'currency': 'BTC',
+    'source_currency': 'USD',
+    'source_rate': '50000',
+    'fee': '0.0001',
+    'expire_at_utc': 1700000000,
+    'created_at_utc': 1699990000,
+    'amount': '0.002',
+    'id': '64d1df01224bd682be0c12c4',
+    'params': {'order_number': '1', 'order_name': 'order', 'source_amount': '100'},
+    'tx': [{'txid': 'a' * 64, 'block': 1, 'confirmations': 3, 'value': '0.002', 'status': 'completed'}],
+}
+
+
+class DictModel:
+    """
+    Copy of a model that keeps its fields in a __dict__, as the models did before __slots__
+    """
+
+    def __init__(self, model: 'plisio.PlisioModel'):
+        for name, value in model._as_dict().items():
+            setattr(self, name, value)
+
+
+def dict_operation(response):
+    operation = plisio.Operation.from_response(response)
+    copy = DictModel(operation)
+    copy.params = DictModel(operation.params)
+    copy.tx = [DictModel(tx) for tx in operation.tx]
+    return copy
+
+
+def bytes_per_operation(build) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    operations = [build(RESPONSE) for _ in range(COUNT)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del operations
+    return used / COUNT
+
+
+def main():
+    print(f'__dict__ models: {bytes_per_operation(dict_operation):.0f} bytes per Operation')
+    print(f'slotted models:  {bytes_per_operation(plisio.Operation.from_response):.0f} bytes per Operation')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,13 @@
 from typing import Union, List, Dict
-from .plisio_enums import CryptoCurrency, FiatCurrency, OperationStatus, OperationType, PlanName
+from .plisio_enums import CryptoCurrency, FiatCurrency, OperationStatus, OperationType, PlanName, PayoutStatus
 
 from .plisio_exceptions import (
     PlisioError,
     RequestNotProcessed,
     RequestAlreadyProcessed,
     UnknownPlisioAPIError,
+    TransportError,
+    OperationsExportError,
     BadRequestError,
     UnauthorizedError,
     ForbiddenError,
@@ -30,10 +32,40 @@ from .plisio_models import (
     Plan,
     FeePlan,
     Operation,
+    LazyOperation,
     Operations,
+    LazyOperations,
 )
 
+from .plisio_json import JsonLoads
+from .plisio_callback import CallbackVerifier, CallbackBody, CallbackDeduplicator
+from .plisio_frame import OperationsFrame
+from .plisio_transport import (
+    TransportResponse,
+    Transport,
+    AioTransport,
+    RequestsTransport,
+    AiohttpTransport,
+    HttpxTransport,
+    AioHttpxTransport,
+    FakeTransport,
+    AioFakeTransport,
+)
 from .plisio_client import PlisioClient, PlisioAioClient
+from .plisio_webhook import WebhookEvent, WebhookReceiver
+from .plisio_cache import SingleFlight, ResponseCache
+from .plisio_retry import RetryPolicy
+from .plisio_ratelimit import (
+    RateLimitBackend,
+    LocalRateLimitBackend,
+    SQLiteRateLimitBackend,
+    TokenBucket,
+    AioTokenBucket,
+)
+from .plisio_poller import InvoicePoller, InvoiceStatusEvent
+from .plisio_rates import RateTable, RateTableRefresher
+from .plisio_fee_quote import FeeQuote, FeeQuoteCache
+from .plisio_payout import Payout, PayoutOutcome, PayoutEngine
 
 RType = Union[List['RType'], Dict[str, 'RType']]
 
@@ -48,5 +80,7 @@ ModelType = Union[
     'plisio.Plan',
     'plisio.FeePlan',
     'plisio.Operation',
+    'plisio.LazyOperation',
     'plisio.Operations',
+    'plisio.LazyOperations',
 ]
@@ -0,0 +1,178 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import partial
+
+import asyncio
+import threading
+import time
+
+from .plisio_client import _PlisioUrl, _NON_IDEMPOTENT_URLS
+
+
+_MISSING = object()
+
+
+class SingleFlight:
+    """
+    Concurrent calls with the same key share one call and its result.
+    calls counts the calls made and shared the calls that joined one in flight.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.shared = 0
+
+        self.__lock = threading.Lock()
+        self.__flights: Dict[Hashable, Future] = {}
+        self.__aio_flights: Dict[Hashable, asyncio.Future] = {}
+
+    def call(self, key: Hashable, call: Callable[[], Any]) -> Any:
+        """
+        Result of call, or of the call with the same key already in flight
+        """
+        with self.__lock:
+            flight = self.__flights.get(key)
+            leader = flight is None
+            if leader:
+                self.calls += 1
+                flight = self.__flights[key] = Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return flight.result()
+        try:
+            value = call()
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(value)
+            return value
+        finally:
+            with self.__lock:
+                del self.__flights[key]
+
+    async def acall(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async analogue of call.
+        The shared call runs as a task, so a cancelled caller does not cancel it for the others.
+        """
+        with self.__lock:
+            flight = self.__aio_flights.get(key)
+            if flight is None:
+                self.calls += 1
+                flight = self.__aio_flights[key] = asyncio.ensure_future(call())
+                flight.add_done_callback(partial(self.__land, key))
+            else:
+                self.shared += 1
+        return await asyncio.shield(flight)
+
+    def __land(self, key: Hashable, flight: asyncio.Future):
+        with self.__lock:
+            if self.__aio_flights.get(key) is flight:
+                del self.__aio_flights[key]
+        if not flight.cancelled():
+            flight.exception()
+
+
+class ResponseCache:
+    """
+    LRU cache of parsed API responses with a TTL per endpoint.
+    Only endpoints listed in ttl are cached, invoices and withdrawals never are.
+    Concurrent misses of the same request share one call to the API.
+    """
+    default_ttl = {
+        _PlisioUrl.currencies: 30,
+        _PlisioUrl.fee_plan: 30,
+    }
+
+    def __init__(self, ttl: Optional[Dict[str, float]] = None, maxsize: int = 1024):
+        if ttl is None:
+            ttl = self.default_ttl
+        for endpoint in ttl:
+            if endpoint in _NON_IDEMPOTENT_URLS:
+                raise ValueError(f'Responses of {endpoint} can not be cached')
+        self.ttl = dict(ttl)
+        self.maxsize = maxsize
+        self.misses = 0
+
+        self.__hits = 0
+        self.__entries = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__single_flight = SingleFlight()
+
+    @property
+    def hits(self) -> int:
+        return self.__hits + self.__single_flight.shared
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def __lookup(self, key: Hashable) -> Any:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self.__entries[key]
+                return _MISSING
+            self.__entries.move_to_end(key)
+            self.__hits += 1
+            return value
+
+    def __miss(self):
+        with self.__lock:
+            self.misses += 1
+
+    def __store(self, key: Hashable, endpoint: str, value: Any):
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + self.ttl[endpoint], value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxsize:
+                self.__entries.popitem(last=False)
+
+    def get_or_call(self, key: Hashable, endpoint: str, call: Callable[[], Any]) -> Any:
+        """
+        Cached value for the key, or the result of call, which is stored for the endpoint's TTL
+        """
+        if endpoint not in self.ttl:
+            return call()
+        value = self.__lookup(key)
+        if value is not _MISSING:
+            return value
+
+        def load() -> Any:
+            value_ = self.__lookup(key)
+            if value_ is _MISSING:
+                self.__miss()
+                value_ = call()
+                self.__store(key, endpoint, value_)
+            return value_
+
+        return self.__single_flight.call(key, load)
+
+    async def aget_or_call(self, key: Hashable, endpoint: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Async analogue of get_or_call
+        """
+        if endpoint not in self.ttl:
+            return await call()
+        value = self.__lookup(key)
+        if value is not _MISSING:
+            return value
+
+        async def load() -> Any:
+            value_ = self.__lookup(key)
+            if value_ is _MISSING:
+                self.__miss()
+                value_ = await call()
+                self.__store(key, endpoint, value_)
+            return value_
+
+        return await self.__single_flight.acall(key, load)
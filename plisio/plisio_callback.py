@@ -0,0 +1,177 @@
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from collections import OrderedDict
+
+import asyncio
+import hashlib
+import hmac
+import json
+import threading
+
+import plisio
+
+from .plisio_sqlite import _SQLiteDatabase
+
+
+CallbackBody = Union[str, bytes, bytearray, memoryview]
+
+
+class CallbackVerifier:
+    """
+    Verifies verify_hash of callbacks sent by Plisio with ?json=true.
+    The HMAC key is prepared once and copied for every callback.
+    """
+
+    def __init__(self, api_key: str, json_loads: Optional['plisio.JsonLoads'] = None):
+        """
+        json_loads decodes callback bodies, the standard json by default.
+        The signed string is built again from the decoded body by the standard json encoder,
+        so a custom decoder has to keep every value as the standard one does:
+        orjson turns integers wider than 64 bits into floats and valid callbacks are then rejected.
+        """
+        self.__hmac = hmac.new(bytes(str(api_key), 'utf8'), digestmod=hashlib.sha1)
+        self.__encode = json.JSONEncoder(separators=(',', ':')).encode
+        self.__loads = json_loads or json.loads
+
+    def load(self, data: CallbackBody) -> Optional[Dict]:
+        """
+        The callback payload if its verify_hash is valid, otherwise None
+        """
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        try:
+            json_obj = self.__loads(data)
+        except ValueError:
+            return None
+        if not isinstance(json_obj, dict):
+            return None
+        verify_hash = json_obj.pop('verify_hash', None)
+        if not isinstance(verify_hash, str):
+            return None
+        digester = self.__hmac.copy()
+        digester.update(self.__encode(json_obj).encode('utf8'))
+        if not hmac.compare_digest(digester.hexdigest().encode('utf8'), verify_hash.encode('utf8')):
+            return None
+        json_obj['verify_hash'] = verify_hash
+        return json_obj
+
+    def verify(self, data: CallbackBody) -> bool:
+        return self.load(data) is not None
+
+    def verify_many(self, bodies: Iterable[CallbackBody]) -> List[bool]:
+        load = self.load
+        return [load(data) is not None for data in bodies]
+
+
+class CallbackDeduplicator:
+    """
+    Drops repeated deliveries of the same callback.
+    Callbacks are told apart by (txn_id, status, verify_hash) and remembered in a bounded
+    in-memory LRU and, when path is given, in a SQLite database that survives restarts.
+    """
+
+    def __init__(self, maxsize: int = 100000, path: Optional[str] = None, timeout: float = 30):
+        self.maxsize = maxsize
+        self.path = path
+        self.timeout = timeout
+
+        self.passed = 0
+        self.hits = 0
+        self.store_hits = 0
+
+        self.__seen = OrderedDict()
+        self.__lock = threading.Lock()
+        self.__database = None if path is None else _SQLiteDatabase(path, timeout)
+        if self.__database is not None:
+            self.__database.execute(
+                'CREATE TABLE IF NOT EXISTS plisio_callbacks '
+                '(txn_id TEXT NOT NULL, status TEXT NOT NULL, verify_hash TEXT NOT NULL, '
+                'PRIMARY KEY (txn_id, status, verify_hash))'
+            )
+
+    @property
+    def dropped(self) -> int:
+        return self.hits + self.store_hits
+
+    @staticmethod
+    def key(payload: Dict) -> Tuple[str, str, str]:
+        return (
+            str(payload.get('txn_id') or payload.get('id') or ''),
+            str(payload.get('status') or ''),
+            str(payload.get('verify_hash') or ''),
+        )
+
+    def __remember(self, key: Tuple[str, str, str]) -> bool:
+        with self.__lock:
+            if key in self.__seen:
+                self.__seen.move_to_end(key)
+                self.hits += 1
+                return True
+            self.__seen[key] = None
+            if len(self.__seen) > self.maxsize:
+                self.__seen.popitem(last=False)
+        return False
+
+    def __store(self, key: Tuple[str, str, str]) -> bool:
+        if self.__database is not None:
+            cursor = self.__database.execute(
+                'INSERT OR IGNORE INTO plisio_callbacks (txn_id, status, verify_hash) VALUES (?, ?, ?)',
+                key,
+            )
+            if cursor.rowcount == 0:
+                with self.__lock:
+                    self.store_hits += 1
+                return True
+        with self.__lock:
+            self.passed += 1
+        return False
+
+    def __delete(self, key: Tuple[str, str, str]):
+        if self.__database is not None:
+            self.__database.execute(
+                'DELETE FROM plisio_callbacks WHERE txn_id = ? AND status = ? AND verify_hash = ?',
+                key,
+            )
+
+    def seen(self, payload: Dict) -> bool:
+        """
+        Whether the callback has been seen before; a new callback is remembered
+        """
+        key = self.key(payload)
+        return self.__remember(key) or self.__store(key)
+
+    async def aseen(self, payload: Dict) -> bool:
+        """
+        seen for the event loop: the in-memory check is made at once, the database is used in the default executor
+        """
+        key = self.key(payload)
+        if self.__remember(key):
+            return True
+        if self.__database is None:
+            return self.__store(key)
+        return await asyncio.get_event_loop().run_in_executor(None, self.__store, key)
+
+    def discard(self, payload: Dict):
+        """
+        Forget the callback, so that its next delivery is not dropped
+        """
+        key = self.key(payload)
+        with self.__lock:
+            self.__seen.pop(key, None)
+        self.__delete(key)
+
+    async def adiscard(self, payload: Dict):
+        """
+        discard for the event loop
+        """
+        key = self.key(payload)
+        with self.__lock:
+            self.__seen.pop(key, None)
+        if self.__database is not None:
+            await asyncio.get_event_loop().run_in_executor(None, self.__delete, key)
+
+    def close(self):
+        """
+        Close the database connections
+        """
+        if self.__database is not None:
+            self.__database.close()
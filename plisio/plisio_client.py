@@ -1,10 +1,10 @@
-from typing import Type, Dict, Optional, Union, List, Any
+from typing import Type, Dict, Optional, Union, List, Any, Callable, Iterable, Iterator, AsyncIterator
+from concurrent.futures import Future, ThreadPoolExecutor
 
-import aiohttp
-import requests
-import json
-import hmac
-import hashlib
+import asyncio
+import collections
+import threading
+import time
 
 import plisio
 
@@ -20,6 +20,9 @@ class _PlisioUrl:
     operations = 'operations'
 
 
+_NON_IDEMPOTENT_URLS = frozenset({_PlisioUrl.invoice, _PlisioUrl.withdraw})
+
+
 class _PlisioRequest:
     def __init__(
             self,
@@ -27,11 +30,13 @@ class _PlisioRequest:
             data: Dict[str, Any],
             response_class: Type['plisio.PlisioModel'],
             method: str = 'get',
+            endpoint: Optional[str] = None,
     ):
         self.url = url
         self.data = data
         self.__response_class = response_class
         self.method = method
+        self.endpoint = endpoint
 
         self.__processed = False
         self.__response_status = None
@@ -46,8 +51,10 @@ class _PlisioRequest:
 
     def __handle_processed_request(self, response_dict: 'plisio.RType') -> 'plisio.ModelType':
         if self.response_status in [200, 201]:
-            if self.__response_class is not None:
-                data: 'plisio.RType' = response_dict['data']
+            data: 'plisio.RType' = response_dict['data']
+            if self.__response_class is None:
+                self.__response = data
+            else:
                 if isinstance(data, list):
                     self.__response = self.__response_class.list_of_models(data)
                 else:
@@ -81,6 +88,17 @@ class _PlisioRequest:
             raise plisio.ServiceUnavailableError(message)
         raise plisio.PlisioError(message)
 
+    @property
+    def idempotent(self) -> bool:
+        return self.method == 'get' and self.endpoint not in _NON_IDEMPOTENT_URLS
+
+    @property
+    def key(self) -> tuple:
+        """
+        Identifies requests that get the same response
+        """
+        return self.method, self.url, tuple(sorted(self.data.items()))
+
     @property
     def response_status(self) -> int:
         if self.__processed:
@@ -97,9 +115,74 @@ class _PlisioRequest:
 class _BaseClient:
     _url = _PlisioUrl
     __api_url = 'https://api.plisio.net/api/v1/'
+    _invoice_defaults = {
+        'amount': None,
+        'source_currency': None,
+        'source_amount': None,
+        'allowed_currencies': None,
+        'description': None,
+        'callback_url': None,
+        'email': None,
+        'language': 'en_US',
+        'plugin': None,
+        'version': None,
+        'redirect_to_invoice': None,
+        'expire_min': None,
+    }
 
-    def __init__(self, api_key: str):
+    def __init__(
+            self,
+            api_key: str,
+            cache: Optional['plisio.ResponseCache'] = None,
+            retry: Optional['plisio.RetryPolicy'] = None,
+            rate_limit: Optional[Union['plisio.TokenBucket', 'plisio.AioTokenBucket', Dict]] = None,
+            lazy_models: bool = False,
+            json_loads: Optional['plisio.JsonLoads'] = None,
+            coalesce: bool = False,
+    ):
+        """
+        rate_limit is a token bucket for all requests,
+        or a dict of buckets by _PlisioUrl endpoint with the None key for the rest.
+        With lazy_models operations are LazyOperation, decoded field by field on access.
+        json_loads decodes response bodies; orjson or ujson is used by default when installed.
+        With coalesce concurrent identical requests, except invoices and withdrawals, share one call.
+        """
         self.__api_key = api_key
+        self.__callback_verifier = None
+        self.json_loads = json_loads or plisio.plisio_json.json_loads
+        self.cache = cache
+        self.retry = retry
+        self.rate_limit = rate_limit
+        self.single_flight = plisio.SingleFlight() if coalesce else None
+        self._operation_class = plisio.LazyOperation if lazy_models else plisio.Operation
+        self._operations_class = plisio.LazyOperations if lazy_models else plisio.Operations
+
+    def _response_data(self, response: 'plisio.TransportResponse') -> 'plisio.RType':
+        """
+        Decoded body of the response; a redirected invoice request yields the url of the invoice page
+        """
+        if response.redirect_url is not None:
+            return {'status': 'redirect', 'data': {'invoice_url': response.redirect_url}}
+        return self.json_loads(response.content)
+
+    @staticmethod
+    def _collect_balances(
+            currencies: List['plisio.CryptoCurrency'],
+            results: List[Union['plisio.Balance', BaseException]],
+    ) -> Dict['plisio.CryptoCurrency', 'plisio.Balance']:
+        balances = {}
+        for currency, result in zip(currencies, results):
+            if isinstance(result, plisio.PlisioError):
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            balances[currency] = result
+        return balances
+
+    def _rate_limiter(self, request: '_PlisioRequest') -> Optional[Union['plisio.TokenBucket', 'plisio.AioTokenBucket']]:
+        if isinstance(self.rate_limit, dict):
+            return self.rate_limit.get(request.endpoint, self.rate_limit.get(None))
+        return self.rate_limit
 
     @staticmethod
     def __prepare_data(data: Dict[str, Any]):
@@ -116,29 +199,34 @@ class _BaseClient:
 
     def __create_request(
             self,
-            uri: str,
+            endpoint: str,
             data: Dict[str, Any],
             response_class: Type['plisio.PlisioModel'],
             method: str = 'get',
+            resource: Optional[str] = None,
     ) -> '_PlisioRequest':
-        url = self.__api_url + uri
+        """
+        Request to the endpoint, one of _PlisioUrl, or to endpoint/resource
+        """
+        url = self.__api_url + endpoint + ('/' + resource if resource else '')
         self.__prepare_data(data)
         data['api_key'] = self.__api_key
-        return _PlisioRequest(url, data, response_class, method)
+        return _PlisioRequest(url, data, response_class, method, endpoint)
 
     def _get_balance_request(self, **kwargs) -> '_PlisioRequest':
         return self.__create_request(
-            self._url.balance + '/' + kwargs['currency'].name,
+            self._url.balance,
             {},
-            plisio.Balance
+            plisio.Balance,
+            resource=kwargs['currency'].name,
         )
 
     def _get_currencies_request(self, **kwargs) -> '_PlisioRequest':
-        url_ = '/' + kwargs['fiat_currency'].name if kwargs.get('fiat_currency') else ''
         return self.__create_request(
-            self._url.currencies + url_,
+            self._url.currencies,
             {},
-            plisio.Currency
+            plisio.Currency,
+            resource=kwargs.get('fiat_currency') and kwargs['fiat_currency'].name,
         )
 
     def _invoice_request(self, **kwargs) -> '_PlisioRequest':
@@ -166,9 +254,12 @@ class _BaseClient:
             plisio.Invoice
         )
 
+    def _invoice_spec_request(self, spec: Dict[str, Any]) -> '_PlisioRequest':
+        return self._invoice_request(**{**self._invoice_defaults, **spec})
+
     def _get_commission_request(self, **kwargs) -> '_PlisioRequest':
         return self.__create_request(
-            self._url.commission + '/' + kwargs['crypto_currency'].name,
+            self._url.commission,
             {
                 'addresses': kwargs['addresses'] and ','.join(kwargs['addresses']),
                 'amounts':
@@ -179,7 +270,8 @@ class _BaseClient:
                 'feePlan': kwargs['fee_plan'] and kwargs['fee_plan'].name,
                 'customFeeRate': kwargs['custom_fee_rate'],
             },
-            plisio.Commission
+            plisio.Commission,
+            resource=kwargs['crypto_currency'].name,
         )
 
     def _withdraw_request(self, **kwargs) -> '_PlisioRequest':
@@ -201,7 +293,7 @@ class _BaseClient:
 
     def _get_fee_request(self, **kwargs) -> '_PlisioRequest':
         return self.__create_request(
-            self._url.fee + '/' + kwargs['currency'].name,
+            self._url.fee,
             {
                 'addresses':
                     ','.join(kwargs['addresses']) if isinstance(kwargs['addresses'], list) else kwargs['addresses'],
@@ -211,69 +303,237 @@ class _BaseClient:
                     else "{:.8f}".format(kwargs['amounts']),
                 'feePlan': kwargs['fee_plan'] and kwargs['fee_plan'].name,
             },
-            plisio.Fee
+            plisio.Fee,
+            resource=kwargs['currency'].name,
         )
 
     def _get_fee_plan_request(self, **kwargs) -> '_PlisioRequest':
         return self.__create_request(
-            self._url.fee_plan + '/' + kwargs['currency'].name,
+            self._url.fee_plan,
             {},
-            plisio.FeePlan
+            plisio.FeePlan,
+            resource=kwargs['currency'].name,
         )
 
     def _get_operations_request(self, **kwargs) -> '_PlisioRequest':
         return self.__create_request(
             self._url.operations,
-            {
-                'page': kwargs['page'],
-                'limit': kwargs['limit'],
-                'shop_id': kwargs['shop_id'],
-                'type': kwargs['type_'] and plisio.OperationType[kwargs['type_']],
-                'status': kwargs['status'] and plisio.OperationStatus[kwargs['status']],
-                'currency': kwargs['currency'] and plisio.CryptoCurrency[kwargs['currency']],
-                'search': kwargs['search'],
-            },
-            plisio.Operations
+            self.__operations_filters(kwargs),
+            self._operations_class
         )
 
+    def _get_operations_page_request(self, **kwargs) -> '_PlisioRequest':
+        """
+        Same as _get_operations_request, but the response is the raw page dict
+        """
+        return self.__create_request(
+            self._url.operations,
+            self.__operations_filters(kwargs),
+            None
+        )
+
+    @staticmethod
+    def __operations_filters(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            'page': kwargs['page'],
+            'limit': kwargs['limit'],
+            'shop_id': kwargs['shop_id'],
+            'type': kwargs['type_'] and plisio.OperationType[kwargs['type_']],
+            'status': kwargs['status'] and plisio.OperationStatus[kwargs['status']],
+            'currency': kwargs['currency'] and plisio.CryptoCurrency[kwargs['currency']],
+            'search': kwargs['search'],
+        }
+
+    @staticmethod
+    def _next_operations_page(page: 'plisio.RType') -> Optional[int]:
+        """
+        Number of the page after the given raw operations page, or None for the last one
+        """
+        if not page.get('operations'):
+            return None
+        meta = page.get('_meta') or {}
+        current_page = meta.get('currentPage')
+        if current_page is None:
+            return None
+        page_count = meta.get('pageCount')
+        if page_count is not None:
+            return current_page + 1 if current_page < page_count else None
+        if 'next' in (page.get('_links') or {}):
+            return current_page + 1
+        return None
+
     def _get_operation_request(self, **kwargs) -> '_PlisioRequest':
         return self.__create_request(
-            self._url.operations + '/' + kwargs['id_'],
+            self._url.operations,
             {},
-            plisio.Operation
+            self._operation_class,
+            resource=kwargs['id_'],
         )
 
-    def validate_callback(self, data: str) -> bool:
-        json_obj = json.loads(data)
-        verify_hash = json_obj['verify_hash']
-        del json_obj["verify_hash"]
-        json.dumps(json_obj, sort_keys=True)
-        key = bytes(str(self.__api_key), 'utf8')
-        post_str = bytes(json.dumps(json_obj, separators=(',', ':')), 'utf8')
-        digester = hmac.new(key, post_str, hashlib.sha1)
-        hash_ = digester.hexdigest()
-        return hash_ == verify_hash
+    @property
+    def callback_verifier(self) -> 'plisio.CallbackVerifier':
+        if self.__callback_verifier is None:
+            self.__callback_verifier = plisio.CallbackVerifier(self.__api_key)
+        return self.__callback_verifier
+
+    def validate_callback(self, data: 'plisio.CallbackBody') -> bool:
+        return self.callback_verifier.verify(data)
 
 
 class PlisioClient(_BaseClient):
-    @staticmethod
-    def _send_request(request: '_PlisioRequest') -> 'plisio.ModelType':
-        try:
-            _req = requests.request(
-                request.method,
-                request.url,
-                params=request.data,
-            )
-            status = _req.status_code
-            if _req.history:
-                data = {'status': 'redirect', 'data': {'invoice_url': _req.url}}
+    def __init__(
+            self,
+            api_key: str,
+            session: Optional['requests.Session'] = None,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            timeout: Optional[float] = None,
+            cache: Optional['plisio.ResponseCache'] = None,
+            retry: Optional['plisio.RetryPolicy'] = None,
+            rate_limit: Optional[Union['plisio.TokenBucket', Dict[Optional[str], 'plisio.TokenBucket']]] = None,
+            lazy_models: bool = False,
+            json_loads: Optional['plisio.JsonLoads'] = None,
+            transport: Optional['plisio.Transport'] = None,
+            max_workers: Optional[int] = None,
+            coalesce: bool = False,
+    ):
+        """
+        By default keeps one pooled requests.Session, shared by all calls and threads.
+        A passed session or transport is used as is and is not closed by the client;
+        session, pool_connections, pool_maxsize and timeout are ignored when transport is passed.
+        max_workers is the size of the thread pool of submit and map, pool_maxsize by default.
+        """
+        super().__init__(api_key, cache, retry, rate_limit, lazy_models, json_loads, coalesce)
+        self._own_transport = transport is None
+        if transport is None:
+            transport = plisio.RequestsTransport(session, pool_connections, pool_maxsize, timeout)
+        self.transport = transport
+        self.max_workers = max_workers or pool_maxsize
+        self.__executor = None
+        self.__executor_lock = threading.Lock()
+        self.__pool_thread = threading.local()
+
+    def close(self):
+        with self.__executor_lock:
+            executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        if self._own_transport:
+            self.transport.close()
+
+    def __enter__(self) -> 'PlisioClient':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _send_request(self, request: '_PlisioRequest') -> 'plisio.ModelType':
+        if not request.idempotent:
+            return self._perform_request(request)
+        if self.cache is not None:
+            return self.cache.get_or_call(request.key, request.endpoint, lambda: self.__coalesce_request(request))
+        return self.__coalesce_request(request)
+
+    def __coalesce_request(self, request: '_PlisioRequest') -> 'plisio.ModelType':
+        if self.single_flight is not None:
+            return self.single_flight.call(request.key, lambda: self._perform_request(request))
+        return self._perform_request(request)
+
+    def _perform_request(self, request: '_PlisioRequest') -> 'plisio.ModelType':
+        limiter = self._rate_limiter(request)
+        attempt = 0
+        while True:
+            attempt += 1
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                response = self.transport.send(request.method, request.url, request.data)
+                if self.retry is not None and self.retry.should_retry(request, attempt, response.status):
+                    time.sleep(self.retry.backoff(attempt, response.headers.get('Retry-After')))
+                    continue
+                data = self._response_data(response)
+            except (plisio.TransportError, ValueError) as te:
+                if self.retry is not None and self.retry.should_retry(request, attempt):
+                    time.sleep(self.retry.backoff(attempt))
+                    continue
+                raise plisio.UnknownPlisioAPIError() from te
             else:
-                data = _req.json()
-        except requests.exceptions.RequestException as re:
-            raise plisio.UnknownPlisioAPIError() from re
-        else:
-            request.set_response(status, data)
-            return request.response
+                request.set_response(response.status, data)
+                return request.response
+
+    def __get_executor(self) -> ThreadPoolExecutor:
+        with self.__executor_lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='plisio')
+            return self.__executor
+
+    def __in_pool(self) -> bool:
+        return getattr(self.__pool_thread, 'active', False)
+
+    def __run_in_pool(self, call: Callable[..., Any], *args, **kwargs) -> Any:
+        self.__pool_thread.active = True
+        return call(*args, **kwargs)
+
+    def submit(self, call: Union['_PlisioRequest', Callable[..., Any]], *args, **kwargs) -> Future:
+        """
+        Run a call on the thread pool of the client and return its future.
+        The call is a prepared request or a function, usually a method of the client:
+        client.submit(client.get_balance, plisio.CryptoCurrency.BTC)
+        A call made from a thread of the pool itself runs at once in that thread,
+        so that a pooled call never waits for a free worker.
+        """
+        if isinstance(call, _PlisioRequest):
+            call, args, kwargs = self._send_request, (call,), {}
+        if self.__in_pool():
+            future = Future()
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(call(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        return self.__get_executor().submit(self.__run_in_pool, call, *args, **kwargs)
+
+    def map(
+            self,
+            calls: Iterable[Union['_PlisioRequest', Callable[[], Any]]],
+            max_workers: Optional[int] = None,
+    ) -> List[Future]:
+        """
+        Submit prepared requests or functions without arguments, running at most max_workers
+        of them at once, and return their futures in the order of calls.
+        Each future holds the result or the exception of its call.
+        Called from a thread of the pool, that thread runs calls too until none is left to start,
+        so the methods built on map, e.g. get_all_balances, can themselves be submitted.
+        """
+        calls = list(calls)
+        futures = [Future() for _ in calls]
+        pending = iter(zip(calls, futures))
+        lock = threading.Lock()
+
+        def run():
+            while True:
+                with lock:
+                    call, future = next(pending, (None, None))
+                if future is None:
+                    return
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    result = self._send_request(call) if isinstance(call, _PlisioRequest) else call()
+                except Exception as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+
+        workers = min(max_workers or len(calls), len(calls))
+        in_pool = self.__in_pool()
+        executor = self.__get_executor()
+        for _ in range(workers - 1 if in_pool else workers):
+            executor.submit(self.__run_in_pool, run)
+        if in_pool:
+            run()
+        return futures
 
     def get_balance(self, currency: 'plisio.CryptoCurrency') -> 'plisio.Balance':
         """
@@ -283,6 +543,20 @@ class PlisioClient(_BaseClient):
         request = self._get_balance_request(currency=currency)
         return self._send_request(request)
 
+    def get_all_balances(
+            self,
+            currencies: Optional[Iterable['plisio.CryptoCurrency']] = None,
+            concurrency: int = 10,
+    ) -> Dict['plisio.CryptoCurrency', 'plisio.Balance']:
+        """
+        /balances/{psys_cid}
+        Get balances of the currencies, all of CryptoCurrency by default, running up to concurrency calls in parallel.
+        Currencies whose balance could not be got are left out.
+        """
+        currencies = list(plisio.CryptoCurrency if currencies is None else currencies)
+        futures = self.map([self._get_balance_request(currency=currency) for currency in currencies], concurrency)
+        return self._collect_balances(currencies, [future.exception() or future.result() for future in futures])
+
     def get_currencies(
             self,
             fiat_currency: Optional['plisio.FiatCurrency'] = None,
@@ -337,6 +611,23 @@ class PlisioClient(_BaseClient):
 
     create_invoice = invoice
 
+    def create_invoices(
+            self,
+            specs: Iterable[Dict[str, Any]],
+            concurrency: int = 10,
+    ) -> List[Union['plisio.Invoice', Exception]]:
+        """
+        /invoices/new
+        Create many invoices at once, running up to concurrency calls in parallel.
+        Each spec holds the keyword arguments of invoice().
+        Results keep the order of specs; a failed invoice gives its exception.
+        """
+        futures = self.map(
+            (lambda spec=spec: self._send_request(self._invoice_spec_request(spec)) for spec in specs),
+            concurrency,
+        )
+        return [future.exception() or future.result() for future in futures]
+
     def get_commission(
             self,
             crypto_currency: 'plisio.CryptoCurrency',
@@ -447,27 +738,154 @@ class PlisioClient(_BaseClient):
         )
         return self._send_request(request)
 
+    def iter_operations(
+            self,
+            limit: Optional[int] = None,
+            shop_id: Optional[str] = None,
+            type_: Optional['plisio.OperationType'] = None,
+            status: Optional['plisio.OperationStatus'] = None,
+            currency: Optional['plisio.CryptoCurrency'] = None,
+            search: Optional[str] = None,
+            page: int = 1,
+            prefetch: bool = False,
+    ) -> Iterator['plisio.Operation']:
+        """
+        /operations
+        Iterate over all user transactions, starting from the page, one page in memory at a time.
+        With prefetch the next page is requested while the current one is consumed.
+        """
+        for operations_page in self._iter_operations_pages(
+                page,
+                prefetch,
+                limit=limit,
+                shop_id=shop_id,
+                type_=type_,
+                status=status,
+                currency=currency,
+                search=search,
+        ):
+            for operation in operations_page['operations']:
+                yield self._operation_class.from_response(operation)
+
+    def get_operations_frame(
+            self,
+            limit: Optional[int] = None,
+            shop_id: Optional[str] = None,
+            type_: Optional['plisio.OperationType'] = None,
+            status: Optional['plisio.OperationStatus'] = None,
+            currency: Optional['plisio.CryptoCurrency'] = None,
+            search: Optional[str] = None,
+            page: int = 1,
+            prefetch: bool = False,
+    ) -> 'plisio.OperationsFrame':
+        """
+        /operations
+        All user transactions, starting from the page, as a columnar OperationsFrame
+        """
+        return plisio.OperationsFrame.from_pages(self._iter_operations_pages(
+            page,
+            prefetch,
+            limit=limit,
+            shop_id=shop_id,
+            type_=type_,
+            status=status,
+            currency=currency,
+            search=search,
+        ))
+
+    def _iter_operations_pages(self, page: int, prefetch: bool, **filters) -> Iterator['plisio.RType']:
+        def fetch(page_: int) -> 'plisio.RType':
+            return self._send_request(self._get_operations_page_request(page=page_, **filters))
+
+        operations_page = fetch(page)
+        while True:
+            next_page = self._next_operations_page(operations_page)
+            next_future = prefetch and next_page and self.submit(fetch, next_page)
+            yield operations_page
+            if next_page is None:
+                return
+            operations_page = next_future.result() if next_future else fetch(next_page)
+
 
 class PlisioAioClient(_BaseClient):
-    @staticmethod
-    async def _send_request(request: '_PlisioRequest'):
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                        request.method,
-                        request.url,
-                        params=request.data,
-                ) as _req:
-                    status = _req.status
-                    if _req.history:
-                        data = {'status': 'redirect', 'data': {'invoice_url': _req.url}}
-                    else:
-                        data = await _req.json()
-        except aiohttp.ClientError as ce:
-            raise plisio.UnknownPlisioAPIError() from ce
-        else:
-            request.set_response(status, data)
-            return request.response
+    def __init__(
+            self,
+            api_key: str,
+            session: Optional['aiohttp.ClientSession'] = None,
+            limit: int = 100,
+            limit_per_host: int = 0,
+            ttl_dns_cache: Optional[int] = 10,
+            keepalive_timeout: float = 15,
+            timeout: Optional[float] = None,
+            cache: Optional['plisio.ResponseCache'] = None,
+            retry: Optional['plisio.RetryPolicy'] = None,
+            rate_limit: Optional[Union['plisio.AioTokenBucket', Dict[Optional[str], 'plisio.AioTokenBucket']]] = None,
+            lazy_models: bool = False,
+            json_loads: Optional['plisio.JsonLoads'] = None,
+            transport: Optional['plisio.AioTransport'] = None,
+            coalesce: bool = False,
+    ):
+        """
+        By default keeps one aiohttp.ClientSession, created on the first request.
+        A passed session or transport is used as is and is not closed by the client;
+        the session and connection options are ignored when transport is passed.
+        """
+        super().__init__(api_key, cache, retry, rate_limit, lazy_models, json_loads, coalesce)
+        self._own_transport = transport is None
+        if transport is None:
+            transport = plisio.AiohttpTransport(
+                session,
+                limit,
+                limit_per_host,
+                ttl_dns_cache,
+                keepalive_timeout,
+                timeout,
+            )
+        self.transport = transport
+
+    async def close(self):
+        if self._own_transport:
+            await self.transport.close()
+
+    async def __aenter__(self) -> 'PlisioAioClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _send_request(self, request: '_PlisioRequest'):
+        if not request.idempotent:
+            return await self._perform_request(request)
+        if self.cache is not None:
+            return await self.cache.aget_or_call(request.key, request.endpoint, lambda: self.__coalesce_request(request))
+        return await self.__coalesce_request(request)
+
+    async def __coalesce_request(self, request: '_PlisioRequest'):
+        if self.single_flight is not None:
+            return await self.single_flight.acall(request.key, lambda: self._perform_request(request))
+        return await self._perform_request(request)
+
+    async def _perform_request(self, request: '_PlisioRequest'):
+        limiter = self._rate_limiter(request)
+        attempt = 0
+        while True:
+            attempt += 1
+            if limiter is not None:
+                await limiter.acquire()
+            try:
+                response = await self.transport.send(request.method, request.url, request.data)
+                if self.retry is not None and self.retry.should_retry(request, attempt, response.status):
+                    await asyncio.sleep(self.retry.backoff(attempt, response.headers.get('Retry-After')))
+                    continue
+                data = self._response_data(response)
+            except (plisio.TransportError, ValueError) as te:
+                if self.retry is not None and self.retry.should_retry(request, attempt):
+                    await asyncio.sleep(self.retry.backoff(attempt))
+                    continue
+                raise plisio.UnknownPlisioAPIError() from te
+            else:
+                request.set_response(response.status, data)
+                return request.response
 
     async def get_balance(
             self,
@@ -482,6 +900,27 @@ class PlisioAioClient(_BaseClient):
         )
         return await self._send_request(request)
 
+    async def get_all_balances(
+            self,
+            currencies: Optional[Iterable['plisio.CryptoCurrency']] = None,
+            concurrency: int = 10,
+    ) -> Dict['plisio.CryptoCurrency', 'plisio.Balance']:
+        """
+        /balances/{psys_cid}
+        Async method to get balances of the currencies, all of CryptoCurrency by default,
+        running up to concurrency calls in parallel.
+        Currencies whose balance could not be got are left out.
+        """
+        currencies = list(plisio.CryptoCurrency if currencies is None else currencies)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get(currency: 'plisio.CryptoCurrency') -> 'plisio.Balance':
+            async with semaphore:
+                return await self._send_request(self._get_balance_request(currency=currency))
+
+        results = await asyncio.gather(*[get(currency) for currency in currencies], return_exceptions=True)
+        return self._collect_balances(currencies, results)
+
     async def get_currencies(
             self,
             fiat_currency: Optional['plisio.FiatCurrency'] = None,
@@ -534,6 +973,25 @@ class PlisioAioClient(_BaseClient):
         )
         return await self._send_request(request)
 
+    async def create_invoices(
+            self,
+            specs: Iterable[Dict[str, Any]],
+            concurrency: int = 10,
+    ) -> List[Union['plisio.Invoice', Exception]]:
+        """
+        /invoices/new
+        Async method to create many invoices at once, running up to concurrency calls in parallel.
+        Each spec holds the keyword arguments of invoice().
+        Results keep the order of specs; a failed invoice gives its exception.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def create(spec: Dict[str, Any]) -> 'plisio.Invoice':
+            async with semaphore:
+                return await self._send_request(self._invoice_spec_request(spec))
+
+        return await asyncio.gather(*[create(spec) for spec in specs], return_exceptions=True)
+
     async def get_commission(
             self,
             crypto_currency: 'plisio.CryptoCurrency',
@@ -643,3 +1101,181 @@ class PlisioAioClient(_BaseClient):
             id_=id_,
         )
         return await self._send_request(request)
+
+    def invoice_poller(
+            self,
+            invoice_ids: Iterable[str] = (),
+            rate: float = 5,
+            concurrency: int = 10,
+            keep_alive: bool = False,
+    ) -> 'plisio.InvoicePoller':
+        """
+        /operations/{id}
+        Poller of invoice statuses, tracking the invoices of invoice_ids with at most rate calls per second
+        """
+        poller = plisio.InvoicePoller(self, rate=rate, concurrency=concurrency, keep_alive=keep_alive)
+        for invoice_id in invoice_ids:
+            poller.track(invoice_id)
+        return poller
+
+    async def aiter_operations(
+            self,
+            limit: Optional[int] = None,
+            shop_id: Optional[str] = None,
+            type_: Optional['plisio.OperationType'] = None,
+            status: Optional['plisio.OperationStatus'] = None,
+            currency: Optional['plisio.CryptoCurrency'] = None,
+            search: Optional[str] = None,
+            page: int = 1,
+            prefetch: bool = False,
+    ) -> AsyncIterator['plisio.Operation']:
+        """
+        /operations
+        Async iterator over all user transactions, starting from the page, one page in memory at a time.
+        With prefetch the next page is requested while the current one is consumed.
+        """
+        pages = self._aiter_operations_pages(
+            page,
+            prefetch,
+            limit=limit,
+            shop_id=shop_id,
+            type_=type_,
+            status=status,
+            currency=currency,
+            search=search,
+        )
+        try:
+            async for operations_page in pages:
+                for operation in operations_page['operations']:
+                    yield self._operation_class.from_response(operation)
+        finally:
+            await pages.aclose()
+
+    async def get_operations_frame(
+            self,
+            limit: Optional[int] = None,
+            shop_id: Optional[str] = None,
+            type_: Optional['plisio.OperationType'] = None,
+            status: Optional['plisio.OperationStatus'] = None,
+            currency: Optional['plisio.CryptoCurrency'] = None,
+            search: Optional[str] = None,
+            page: int = 1,
+            prefetch: bool = False,
+    ) -> 'plisio.OperationsFrame':
+        """
+        /operations
+        Async method to get all user transactions, starting from the page, as a columnar OperationsFrame
+        """
+        frame = plisio.OperationsFrame()
+        async for operations_page in self._aiter_operations_pages(
+                page,
+                prefetch,
+                limit=limit,
+                shop_id=shop_id,
+                type_=type_,
+                status=status,
+                currency=currency,
+                search=search,
+        ):
+            frame.extend(operations_page['operations'])
+        return frame
+
+    async def export_operations(
+            self,
+            start_page: int = 1,
+            end_page: Optional[int] = None,
+            concurrency: int = 4,
+            rate: Optional[float] = None,
+            limit: Optional[int] = None,
+            shop_id: Optional[str] = None,
+            type_: Optional['plisio.OperationType'] = None,
+            status: Optional['plisio.OperationStatus'] = None,
+            currency: Optional['plisio.CryptoCurrency'] = None,
+            search: Optional[str] = None,
+    ) -> AsyncIterator['plisio.Operation']:
+        """
+        /operations
+        Async iterator over the pages from start_page to end_page, fetched in parallel.
+        Up to concurrency pages are loaded at once and at most rate pages are requested per second.
+        Operations are yielded in page order. On a failed page OperationsExportError is raised,
+        its next_page is the page to resume the export from.
+        Without pageCount in the response, pages are requested one by one while they link to the next one.
+        """
+        if end_page is not None and end_page < start_page:
+            return
+        filters = {
+            'limit': limit,
+            'shop_id': shop_id,
+            'type_': type_,
+            'status': status,
+            'currency': currency,
+            'search': search,
+        }
+        limiter = rate and plisio.AioTokenBucket(rate, capacity=1)
+
+        async def fetch(page_: int) -> 'plisio.RType':
+            if limiter:
+                await limiter.acquire()
+            return await self._send_request(self._get_operations_page_request(page=page_, **filters))
+
+        def last(operations_page_: 'plisio.RType', page_: int) -> int:
+            if page_count is not None:
+                last_page_ = page_count
+            elif operations_page_.get('operations') and 'next' in (operations_page_.get('_links') or {}):
+                last_page_ = page_ + 1
+            else:
+                last_page_ = page_
+            return min(end_page, last_page_) if end_page else last_page_
+
+        page = start_page
+        try:
+            operations_page = await fetch(page)
+        except Exception as e:
+            raise plisio.OperationsExportError(page) from e
+        page_count = (operations_page.get('_meta') or {}).get('pageCount')
+        last_page = last(operations_page, page)
+        for operation in operations_page.get('operations') or []:
+            yield self._operation_class.from_response(operation)
+
+        tasks = collections.deque()
+        scheduled = page
+        try:
+            while page < last_page:
+                while scheduled < last_page and len(tasks) < concurrency:
+                    scheduled += 1
+                    tasks.append(asyncio.ensure_future(fetch(scheduled)))
+                try:
+                    operations_page = await tasks.popleft()
+                except Exception as e:
+                    raise plisio.OperationsExportError(page + 1) from e
+                page += 1
+                last_page = last(operations_page, page)
+                for operation in operations_page.get('operations') or []:
+                    yield self._operation_class.from_response(operation)
+        finally:
+            for task in tasks:
+                if not task.cancel() and not task.cancelled():
+                    task.exception()
+
+    async def _aiter_operations_pages(self, page: int, prefetch: bool, **filters) -> AsyncIterator['plisio.RType']:
+        async def fetch(page_: int) -> 'plisio.RType':
+            return await self._send_request(self._get_operations_page_request(page=page_, **filters))
+
+        next_task = None
+        try:
+            operations_page = await fetch(page)
+            while True:
+                next_page = self._next_operations_page(operations_page)
+                if prefetch and next_page:
+                    next_task = asyncio.ensure_future(fetch(next_page))
+                yield operations_page
+                if next_page is None:
+                    return
+                if next_task:
+                    operations_page = await next_task
+                    next_task = None
+                else:
+                    operations_page = await fetch(next_page)
+        finally:
+            if next_task:
+                next_task.cancel()
@@ -1,10 +1,26 @@
 from enum import Enum, EnumMeta, auto
+from types import MappingProxyType
 
 
 class _EnumMeta(EnumMeta):
+    def __new__(mcs, cls, bases, classdict, **kwargs):
+        enum_class = super().__new__(mcs, cls, bases, classdict, **kwargs)
+        decode_map = dict(enum_class._member_map_)
+        for name, member in enum_class._member_map_.items():
+            # '_111' is also spelled '111'; spaces and dashes replace the underscores inside a name only
+            name_ = name[1:] if name.startswith('_') else name
+            for spelling in (name_, name_.replace('_', ' '), name_.replace('_', '-')):
+                decode_map.setdefault(spelling, member)
+        enum_class._decode_map_ = MappingProxyType(decode_map)
+        return enum_class
+
     def __getitem__(self, item):
         if item is None:
             return None
+        try:
+            return self._decode_map_[item]
+        except KeyError:
+            pass
         key = item.replace(' ', '_')
         if key not in self._member_map_:
             key = '_' + key
@@ -234,3 +250,10 @@ class PlanName(Enum, metaclass=_EnumMeta):
     normal = auto()
     priority = auto()
     custom = auto()
+
+
+class PayoutStatus(Enum, metaclass=_EnumMeta):
+    pending = auto()
+    paid = auto()
+    failed = auto()
+    invalid = auto()
@@ -22,6 +22,26 @@ class UnknownPlisioAPIError(PlisioError):
     pass
 
 
+class TransportError(PlisioError):
+    """
+    The request could not be sent or its response could not be received.
+    Raised by transports; the clients raise UnknownPlisioAPIError from it.
+    """
+    reason = 'Could not connect to Plisio API'
+
+
+class OperationsExportError(PlisioError):
+    """
+    Operations export has stopped on a failed page.
+    The export can be resumed from next_page.
+    """
+    reason = 'Operations export has been interrupted'
+
+    def __init__(self, next_page: int, message: Optional[str] = None):
+        self.next_page = next_page
+        super().__init__(message)
+
+
 class BadRequestError(PlisioError):
     """
     400 Bad Request.
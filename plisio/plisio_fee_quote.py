@@ -0,0 +1,233 @@
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import logging
+import math
+import threading
+import time
+
+import plisio
+
+
+logger = logging.getLogger(__name__)
+
+
+QuoteKey = Tuple[str, str, Optional['plisio.OperationType'], Optional['plisio.PlanName'], int, int]
+
+
+class FeeQuote:
+    """
+    Fee or commission estimate, with the addresses and amounts it was requested for
+    """
+    __slots__ = ('key', 'estimate', 'fetched_at', 'used_at', 'request')
+
+    def __init__(
+            self,
+            key: QuoteKey,
+            estimate: Union['plisio.Fee', 'plisio.Commission'],
+            request: Callable[[], 'plisio.plisio_client._PlisioRequest'],
+    ):
+        self.key = key
+        self.estimate = estimate
+        self.request = request
+        self.fetched_at = time.monotonic()
+        self.used_at = self.fetched_at
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+
+class FeeQuoteCache:
+    """
+    Recent fee and commission estimates of PlisioClient, so that a withdrawal does not wait for one.
+    Quotes are keyed by the currency, fee plan, and buckets of the address count (powers of 2)
+    and of the total amount (powers of amount_base), and are used while they are younger than max_age.
+    The refresher thread requests again the quotes of the given currencies before they get older than ttl.
+    """
+
+    def __init__(
+            self,
+            client: 'plisio.PlisioClient',
+            ttl: float = 30,
+            currencies: Optional[Iterable['plisio.CryptoCurrency']] = None,
+            refresh_interval: Optional[float] = None,
+            keep_warm: float = 300,
+            amount_base: float = 2,
+    ):
+        """
+        currencies - whose quotes are refreshed in the background, all by default.
+        refresh_interval - how often the refresher runs, ttl / 2 by default.
+        Quotes unused for keep_warm seconds are no longer refreshed.
+        """
+        self.client = client
+        self.ttl = ttl
+        self.currencies = None if currencies is None else frozenset(currencies)
+        self.refresh_interval = ttl / 2 if refresh_interval is None else refresh_interval
+        self.keep_warm = keep_warm
+        self.amount_base = amount_base
+
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+        self.__quotes: Dict[QuoteKey, FeeQuote] = {}
+        self.__lock = threading.Lock()
+        self.__single_flight = plisio.SingleFlight()
+        self.__stopped = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self.__quotes)
+
+    def key(
+            self,
+            kind: str,
+            currency: 'plisio.CryptoCurrency',
+            addresses: Optional[Union[str, List[str]]],
+            amounts: Optional[Union[float, List[float]]],
+            type_: Optional['plisio.OperationType'] = None,
+            fee_plan: Optional['plisio.PlanName'] = None,
+    ) -> QuoteKey:
+        count = len(addresses) if isinstance(addresses, list) else int(bool(addresses))
+        total = sum(amounts) if isinstance(amounts, list) else amounts or 0
+        count_bucket = 1 << max(0, count - 1).bit_length()
+        amount_bucket = math.floor(math.log(total, self.amount_base)) if total > 0 else -1 << 31
+        return kind, currency.name, type_, fee_plan, count_bucket, amount_bucket
+
+    def get_fee(
+            self,
+            currency: 'plisio.CryptoCurrency',
+            addresses: Union[str, List[str]],
+            amounts: Union[float, List[float]],
+            fee_plan: Optional['plisio.PlanName'] = None,
+            max_age: Optional[float] = None,
+    ) -> 'plisio.Fee':
+        """
+        /operations/fee/{psys_cid}
+        Estimate fee, from a quote younger than max_age (ttl by default) if there is one
+        """
+        return self.__get(
+            self.key('fee', currency, addresses, amounts, fee_plan=fee_plan),
+            lambda: self.client._get_fee_request(
+                currency=currency,
+                addresses=addresses,
+                amounts=amounts,
+                fee_plan=fee_plan,
+            ),
+            max_age,
+        )
+
+    def get_commission(
+            self,
+            crypto_currency: 'plisio.CryptoCurrency',
+            addresses: Optional[Union[str, List[str]]] = None,
+            amounts: Optional[Union[float, List[float]]] = None,
+            type_: Optional['plisio.OperationType'] = None,
+            fee_plan: Optional['plisio.PlanName'] = None,
+            max_age: Optional[float] = None,
+    ) -> 'plisio.Commission':
+        """
+        /operations/commission/{psys_cid}
+        Estimate cryptocurrency fee and Plisio commission, from a quote younger than max_age (ttl by default)
+        if there is one
+        """
+        return self.__get(
+            self.key('commission', crypto_currency, addresses, amounts, type_, fee_plan),
+            lambda: self.client._get_commission_request(
+                crypto_currency=crypto_currency,
+                addresses=addresses,
+                amounts=amounts,
+                type_=type_,
+                fee_plan=fee_plan,
+                custom_fee_rate=None,
+            ),
+            max_age,
+        )
+
+    def __get(
+            self,
+            key: QuoteKey,
+            request: Callable[[], 'plisio.plisio_client._PlisioRequest'],
+            max_age: Optional[float],
+    ) -> Union['plisio.Fee', 'plisio.Commission']:
+        max_age = self.ttl if max_age is None else max_age
+        with self.__lock:
+            quote = self.__quotes.get(key)
+            if quote is not None and quote.age <= max_age:
+                quote.used_at = time.monotonic()
+                self.hits += 1
+                return quote.estimate
+            self.misses += 1
+        return self.__fetch(key, request, True).estimate
+
+    def __fetch(
+            self,
+            key: QuoteKey,
+            request: Callable[[], 'plisio.plisio_client._PlisioRequest'],
+            used: bool,
+    ) -> FeeQuote:
+        def fetch() -> FeeQuote:
+            quote = FeeQuote(key, self.client._send_request(request()), request)
+            with self.__lock:
+                previous = self.__quotes.get(key)
+                if previous is not None and not used:
+                    quote.used_at = previous.used_at
+                self.__quotes[key] = quote
+            return quote
+
+        return self.__single_flight.call(key, fetch)
+
+    def refresh(self) -> int:
+        """
+        Request again the quotes of the currencies that are older than refresh_interval
+        and have been used within keep_warm; returns the number of refreshed quotes
+        """
+        now = time.monotonic()
+        with self.__lock:
+            quotes = [
+                quote for quote in self.__quotes.values()
+                if now - quote.used_at <= self.keep_warm
+                and now - quote.fetched_at >= self.refresh_interval
+                and (self.currencies is None or plisio.CryptoCurrency[quote.key[1]] in self.currencies)
+            ]
+            for key in [key for key, quote in self.__quotes.items() if now - quote.used_at > self.keep_warm]:
+                del self.__quotes[key]
+        refreshed = 0
+        for quote in quotes:
+            try:
+                self.__fetch(quote.key, quote.request, False)
+            except plisio.PlisioError:
+                continue
+            refreshed += 1
+        self.refreshes += refreshed
+        return refreshed
+
+    def start(self):
+        """
+        Start the refresher thread
+        """
+        if self.__thread is not None:
+            return
+        self.__stopped.clear()
+        self.__thread = threading.Thread(target=self.__refresh_forever, name='plisio-fee-quotes', daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        self.__stopped.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            self.__thread = None
+
+    def __enter__(self) -> 'FeeQuoteCache':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def __refresh_forever(self):
+        while not self.__stopped.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception('Plisio fee quotes refresh failed')
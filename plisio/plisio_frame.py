@@ -0,0 +1,169 @@
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Type, Union
+from array import array
+from enum import Enum
+from itertools import compress
+
+import math
+
+import plisio
+from .plisio_enums import CryptoCurrency, FiatCurrency, OperationStatus, OperationType
+
+
+Column = Union[array, List[Optional[str]]]
+
+
+class OperationsFrame:
+    """
+    Columnar container of operations, built from raw /operations pages without Operation models.
+    Numeric fields are kept in array.array buffers (NaN or 0 when missing),
+    enum fields as int8/int16 codes (-1 when missing) and ids as lists of strings.
+    Columns support the buffer protocol, e.g. numpy.frombuffer(frame.column('amount')).
+    """
+    float_columns = (
+        'amount',
+        'fee',
+        'sum',
+        'commission',
+        'pending_sum',
+        'source_rate',
+        'actual_sum',
+        'actual_commission',
+        'actual_fee',
+        'actual_invoice_sum',
+    )
+    int_columns = (
+        'user_id',
+        'created_at_utc',
+        'expire_at_utc',
+        'status_code',
+    )
+    code_columns = {
+        'type': OperationType,
+        'status': OperationStatus,
+        'currency': CryptoCurrency,
+        'source_currency': FiatCurrency,
+    }
+    str_columns = (
+        'id',
+        'shop_id',
+        'wallet_hash',
+        'tx_url',
+    )
+
+    def __init__(self, columns: Optional[Dict[str, Column]] = None):
+        if columns is None:
+            columns = self.__empty_columns()
+        self.__columns = columns
+
+    @classmethod
+    def __empty_columns(cls) -> Dict[str, Column]:
+        columns = {}
+        for name in cls.float_columns:
+            columns[name] = array('d')
+        for name in cls.int_columns:
+            columns[name] = array('q')
+        for name, enum in cls.code_columns.items():
+            columns[name] = array('b' if len(enum) < 128 else 'h')
+        for name in cls.str_columns:
+            columns[name] = []
+        return columns
+
+    @staticmethod
+    def __codes(enum: Type[Enum]) -> Dict[Enum, int]:
+        return {member: code for code, member in enumerate(enum)}
+
+    @classmethod
+    def from_pages(cls, pages: Iterable['plisio.RType']) -> 'OperationsFrame':
+        frame = cls()
+        for page in pages:
+            frame.extend(page.get('operations') or [])
+        return frame
+
+    def extend(self, operations: Iterable['plisio.RType']):
+        """
+        Append raw operation dicts, as found in the operations of a page
+        """
+        columns = self.__columns
+        codes = {name: self.__codes(enum) for name, enum in self.code_columns.items()}
+        for operation in operations:
+            for name in self.float_columns:
+                value = operation.get(name)
+                columns[name].append(float(value) if value not in (None, '') else math.nan)
+            for name in self.int_columns:
+                value = operation.get(name)
+                columns[name].append(int(value) if value not in (None, '') else 0)
+            for name, enum in self.code_columns.items():
+                value = operation.get(name)
+                try:
+                    code = codes[name][enum[value]] if value else -1
+                except KeyError:
+                    code = -1
+                columns[name].append(code)
+            for name in self.str_columns:
+                value = operation.get(name)
+                columns[name].append(value if value is None else str(value))
+
+    def __len__(self) -> int:
+        return len(self.__columns['id'])
+
+    def column(self, name: str) -> Column:
+        """
+        The column itself, not a copy; numeric columns can be wrapped by memoryview or numpy
+        """
+        return self.__columns[name]
+
+    def decoded(self, name: str) -> List[Optional[Enum]]:
+        """
+        Enum members of a code column
+        """
+        members = list(self.code_columns[name])
+        return [members[code] if code >= 0 else None for code in self.__columns[name]]
+
+    def __mask(self, name: str, value: Any) -> List[bool]:
+        values = value if isinstance(value, (list, tuple, set, frozenset)) else (value,)
+        if name in self.code_columns:
+            codes = self.__codes(self.code_columns[name])
+            values = {codes[v] for v in values}
+        else:
+            values = set(values)
+        return [v in values for v in self.__columns[name]]
+
+    def filter(self, mask: Optional[Sequence[bool]] = None, **conditions) -> 'OperationsFrame':
+        """
+        New frame with the rows where mask is true and every column equals the condition value
+        (or one of the values, if a collection is given). Enum columns take enum members.
+        """
+        for name, value in conditions.items():
+            column_mask = self.__mask(name, value)
+            mask = column_mask if mask is None else [a and b for a, b in zip(mask, column_mask)]
+        if mask is None:
+            return self
+        columns = {}
+        for name, column in self.__columns.items():
+            if isinstance(column, array):
+                columns[name] = array(column.typecode, compress(column, mask))
+            else:
+                columns[name] = list(compress(column, mask))
+        return OperationsFrame(columns)
+
+    def group_sum(self, by: Union[str, Sequence[str]], column: str = 'amount') -> Dict[Any, float]:
+        """
+        Sums of the column grouped by one or several columns; enum groups are keyed by members.
+        Missing (NaN) values are skipped.
+        """
+        names = (by,) if isinstance(by, str) else tuple(by)
+        keys = zip(*(self.__columns[name] for name in names))
+        sums = {}
+        for key, value in zip(keys, self.__columns[column]):
+            if value == value:
+                sums[key] = sums.get(key, 0.0) + value
+        decoders = [list(self.code_columns[name]) if name in self.code_columns else None for name in names]
+
+        def decode(key: tuple) -> Any:
+            key = tuple(
+                (members[value] if value >= 0 else None) if members is not None else value
+                for members, value in zip(decoders, key)
+            )
+            return key[0] if len(key) == 1 else key
+
+        return {decode(key): total for key, total in sums.items()}
@@ -0,0 +1,26 @@
+from typing import Any, Callable, Union
+
+import json
+
+
+JsonLoads = Callable[[Union[str, bytes]], Any]
+
+
+def _default_json_loads() -> JsonLoads:
+    """
+    The fastest available decoder: orjson, ujson or the standard json
+    """
+    try:
+        import orjson
+        return orjson.loads
+    except ImportError:
+        pass
+    try:
+        import ujson
+        return ujson.loads
+    except ImportError:
+        pass
+    return json.loads
+
+
+json_loads: JsonLoads = _default_json_loads()
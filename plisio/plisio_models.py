@@ -1,9 +1,11 @@
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import plisio
 
 
 class PlisioModel:
+    __slots__ = ()
+
     @classmethod
     def from_response(cls, response_dict: 'plisio.RType'):
         raise NotImplementedError()
@@ -15,8 +17,16 @@ class PlisioModel:
             for response_dict in response_list
         ]
 
+    def _as_dict(self) -> Dict[str, Any]:
+        return {
+            name: getattr(self, name)
+            for cls in reversed(type(self).__mro__)
+            for name in cls.__dict__.get('__slots__', ())
+            if not name.startswith('_')
+        }
+
     def __repr__(self):
-        return '<' + f'{super().__repr__()}: ' + str(self.__dict__) + '>'
+        return '<' + f'{super().__repr__()}: ' + str(self._as_dict()) + '>'
 
 
 class Balance(PlisioModel):
@@ -25,6 +35,12 @@ class Balance(PlisioModel):
     Get plisio.CryptoCurrency balance
     """
 
+    __slots__ = (
+        'currency',
+        'balance',
+        'locked_balance',
+    )
+
     def __init__(
             self,
             currency: 'plisio.CryptoCurrency',
@@ -50,6 +66,18 @@ class Currency(PlisioModel):
     List of supported cryptocurrencies
     """
 
+    __slots__ = (
+        'currency',
+        'icon',
+        'rate_usd',
+        'price_usd',
+        'precision',
+        'fiat',
+        'fiat_rate',
+        'min_sum_in',
+        'invoice_commission_percentage',
+    )
+
     def __init__(
             self,
             currency: 'plisio.CryptoCurrency',
@@ -75,7 +103,7 @@ class Currency(PlisioModel):
     @classmethod
     def from_response(cls, response_dict: 'plisio.RType') -> 'Currency':
         return cls(
-            response_dict.get('cid') and plisio.CryptoCurrency[response_dict['cid'].replace('-', '_')],
+            response_dict.get('cid') and plisio.CryptoCurrency[response_dict['cid']],
             response_dict.get('icon') and str(response_dict['icon']),
             response_dict.get('rate_usd') and float(response_dict['rate_usd']),
             response_dict.get('price_usd') and float(response_dict['price_usd']),
@@ -94,6 +122,23 @@ class Invoice(PlisioModel):
     Create new invoice
     """
 
+    __slots__ = (
+        'txn_id',
+        'invoice_url',
+        'amount',
+        'pending_amount',
+        'wallet_hash',
+        'currency',
+        'source_currency',
+        'source_rate',
+        'expected_confirmations',
+        'qr_code',
+        'verify_hash',
+        'invoice_commission',
+        'invoice_sum',
+        'invoice_total_sum',
+    )
+
     def __init__(
             self,
             txn_id: str,
@@ -151,6 +196,15 @@ class Plan(PlisioModel):
     Sub-model for FeePlan, WithdrawParams
     """
 
+    __slots__ = (
+        'conf_target',
+        'fee_rate',
+        'dynamic_field',
+        'plan',
+        'unit',
+        'value',
+    )
+
     def __init__(
             self,
             conf_target: int,
@@ -186,6 +240,14 @@ class FeePlan(PlisioModel):
     Sub-model for Commission
     """
 
+    __slots__ = (
+        'currency',
+        'economy',
+        'normal',
+        'priority',
+        'custom',
+    )
+
     def __init__(
             self,
             currency: 'plisio.CryptoCurrency',
@@ -216,6 +278,14 @@ class Custom(PlisioModel):
     Sub-model for Commission
     """
 
+    __slots__ = (
+        'min',
+        'max',
+        'default',
+        'borders',
+        'unit',
+    )
+
     def __init__(
             self,
             min_: int,
@@ -247,6 +317,19 @@ class Commission(PlisioModel):
     Estimate cryptocurrency fee and Plisio commission
     """
 
+    __slots__ = (
+        'commission',
+        'fee',
+        'max_amount',
+        'plan',
+        'use_wallet',
+        'use_wallet_balance',
+        'plans',
+        'custom',
+        'errors',
+        'custom_fee_rate',
+    )
+
     def __init__(
             self,
             commission: float,
@@ -292,6 +375,13 @@ class WithdrawParams(PlisioModel):
     Sub-model for Withdraw
     """
 
+    __slots__ = (
+        'source_currency',
+        'source_rate',
+        'usd_rate',
+        'fee',
+    )
+
     def __init__(
             self,
             source_currency: 'plisio.CryptoCurrency',
@@ -320,6 +410,23 @@ class Withdraw(PlisioModel):
     Create a copy of invoice
     """
 
+    __slots__ = (
+        'type',
+        'status',
+        'currency',
+        'source_currency',
+        'source_rate',
+        'fee',
+        'wallet_hash',
+        'sendmany',
+        'params',
+        'created_at_utc',
+        'amount',
+        'tx_url',
+        'tx_id',
+        'id',
+    )
+
     def __init__(
             self,
             type_: 'plisio.OperationType',
@@ -378,6 +485,12 @@ class Fee(PlisioModel):
     Estimate fee
     """
 
+    __slots__ = (
+        'fee',
+        'currency',
+        'plan',
+    )
+
     def __init__(
             self,
             fee: float,
@@ -402,6 +515,19 @@ class OperationTx(PlisioModel):
     Sub-model for Operation
     """
 
+    __slots__ = (
+        'txid',
+        'block',
+        'confirmations',
+        'value',
+        'processed',
+        'fail_retry',
+        'fee_rate',
+        'fee_rate_unit',
+        'url',
+        'wallet_hash',
+    )
+
     def __init__(
             self,
             txid: str,
@@ -447,6 +573,19 @@ class OperationParams(PlisioModel):
     Sub-model for Operation
     """
 
+    __slots__ = (
+        'source_currency',
+        'source_rate',
+        'usd_rate',
+        'fee',
+        'order_number',
+        'order_name',
+        'source_amount',
+        'currency',
+        'amount',
+        'email',
+    )
+
     def __init__(
             self,
             order_number: str,
@@ -495,6 +634,35 @@ class Operation(PlisioModel):
     Create new invoice
     """
 
+    __slots__ = (
+        'user_id',
+        'shop_id',
+        'type',
+        'status',
+        'pending_sum',
+        'currency',
+        'source_currency',
+        'source_rate',
+        'fee',
+        'wallet_hash',
+        'sendmany',
+        'params',
+        'expire_at_utc',
+        'created_at_utc',
+        'amount',
+        'sum',
+        'commission',
+        'tx_url',
+        'tx_id',
+        'id',
+        'actual_sum',
+        'actual_commission',
+        'actual_fee',
+        'actual_invoice_sum',
+        'tx',
+        'status_code',
+    )
+
     def __init__(
             self,
             user_id: int,
@@ -551,36 +719,65 @@ class Operation(PlisioModel):
         self.tx = tx
         self.status_code = status_code
 
+    # Decoders of the fields from the response, in the order of __init__ arguments
+    _decoders = {
+        'user_id': lambda r: r.get('user_id') and int(r['user_id']),
+        'shop_id': lambda r: r.get('shop_id'),
+        'type': lambda r: r.get('type') and plisio.OperationType[r['type']],
+        'status': lambda r: r.get('status') and plisio.OperationStatus[r['status']],
+        'pending_sum': lambda r: r.get('pending_sum') and float(r['pending_sum']),
+        'currency': lambda r: r.get('currency') and plisio.CryptoCurrency[r['currency']],
+        'source_currency': lambda r: r.get('source_currency') and plisio.FiatCurrency[r['source_currency']],
+        'source_rate': lambda r: r.get('source_rate') and float(r['source_rate']),
+        'fee': lambda r: r.get('fee') and float(r['fee']),
+        'wallet_hash': lambda r: r.get('wallet_hash'),
+        'sendmany': lambda r: r.get('sendmany') and [[{k: float(v)} for k, v in sm.items()] for sm in r['sendmany']],
+        'params': lambda r: r.get('params') and OperationParams.from_response(r['params']),
+        'expire_at_utc': lambda r: r.get('expire_at_utc') and int(r['expire_at_utc']),
+        'created_at_utc': lambda r: r.get('created_at_utc') and int(r['created_at_utc']),
+        'amount': lambda r: r.get('amount') and float(r['amount']),
+        'sum': lambda r: r.get('sum') and float(r['sum']),
+        'commission': lambda r: r.get('commission') and float(r['commission']),
+        'tx_url': lambda r: r.get('tx_url'),
+        'tx_id': lambda r: r.get('tx_id'),
+        'id': lambda r: r.get('id'),
+        'actual_sum': lambda r: r.get('actual_sum') and float(r['actual_sum']),
+        'actual_commission': lambda r: r.get('actual_commission') and float(r['actual_commission']),
+        'actual_fee': lambda r: r.get('actual_fee') and float(r['actual_fee']),
+        'actual_invoice_sum': lambda r: r.get('actual_invoice_sum') and float(r['actual_invoice_sum']),
+        'tx': lambda r: r.get('tx') and [OperationTx.from_response(tx) for tx in r['tx']],
+        'status_code': lambda r: r.get('status_code') and int(r['status_code']),
+    }
+
     @classmethod
     def from_response(cls, response_dict: 'plisio.RType') -> 'Operation':
-        return cls(
-            response_dict.get('user_id') and int(response_dict['user_id']),
-            response_dict.get('shop_id'),
-            response_dict.get('type') and plisio.OperationType[response_dict['type']],
-            response_dict.get('status') and plisio.OperationStatus[response_dict['status']],
-            response_dict.get('pending_sum') and float(response_dict['pending_sum']),
-            response_dict.get('currency') and plisio.CryptoCurrency[response_dict['currency']],
-            response_dict.get('source_currency') and plisio.FiatCurrency[response_dict['source_currency']],
-            response_dict.get('source_rate') and float(response_dict['source_rate']),
-            response_dict.get('fee') and float(response_dict['fee']),
-            response_dict.get('wallet_hash'),
-            response_dict.get('sendmany') and [[{k: float(v)} for k, v in sm.items()] for sm in response_dict['sendmany']],
-            response_dict.get('params') and OperationParams.from_response(response_dict['params']),
-            response_dict.get('expire_at_utc') and int(response_dict['expire_at_utc']),
-            response_dict.get('created_at_utc') and int(response_dict['created_at_utc']),
-            response_dict.get('amount') and float(response_dict['amount']),
-            response_dict.get('sum') and float(response_dict['sum']),
-            response_dict.get('commission') and float(response_dict['commission']),
-            response_dict.get('tx_url'),
-            response_dict.get('tx_id'),
-            response_dict.get('id'),
-            response_dict.get('actual_sum') and float(response_dict['actual_sum']),
-            response_dict.get('actual_commission') and float(response_dict['actual_commission']),
-            response_dict.get('actual_fee') and float(response_dict['actual_fee']),
-            response_dict.get('actual_invoice_sum') and float(response_dict['actual_invoice_sum']),
-            response_dict.get('tx') and [OperationTx.from_response(tx) for tx in response_dict['tx']],
-            response_dict.get('status_code') and int(response_dict['status_code']),
-        )
+        return cls(*[decode(response_dict) for decode in cls._decoders.values()])
+
+
+class LazyOperation(Operation):
+    """
+    Operation that keeps the response dict
+    and decodes every field on the first access, with the decoders of Operation
+    """
+
+    __slots__ = (
+        '_response',
+    )
+
+    def __init__(self, response_dict: 'plisio.RType'):
+        self._response = response_dict
+
+    @classmethod
+    def from_response(cls, response_dict: 'plisio.RType') -> 'LazyOperation':
+        return cls(response_dict)
+
+    def __getattr__(self, name: str):
+        decoder = self._decoders.get(name)
+        if decoder is None or name == '_response':
+            raise AttributeError(name)
+        value = decoder(self._response)
+        setattr(self, name, value)
+        return value
 
 
 class Operations(PlisioModel):
@@ -588,6 +785,12 @@ class Operations(PlisioModel):
     Wrapper for Operation
     """
 
+    __slots__ = (
+        'operations',
+        'links',
+        'meta',
+    )
+
     def __init__(
             self,
             operations: List['Operation'],
@@ -598,10 +801,24 @@ class Operations(PlisioModel):
         self.links = links
         self.meta = meta
 
+    _operation_class = Operation
+
     @classmethod
     def from_response(cls, response_dict: 'plisio.RType') -> 'Operations':
         return cls(
-            response_dict.get('operations') and [Operation.from_response(op) for op in response_dict['operations']],
+            response_dict.get('operations') and [
+                cls._operation_class.from_response(op) for op in response_dict['operations']
+            ],
             response_dict.get('_links'),
             response_dict.get('_meta'),
         )
+
+
+class LazyOperations(Operations):
+    """
+    Wrapper for LazyOperation
+    """
+
+    __slots__ = ()
+
+    _operation_class = LazyOperation
@@ -0,0 +1,302 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+from collections import OrderedDict
+from functools import partial
+
+import math
+import time
+import uuid
+
+import plisio
+
+from .plisio_sqlite import _SQLiteDatabase
+
+
+class Payout:
+    """
+    Amount to send to one recipient; recipient_id identifies the payout in the ledger
+    """
+    __slots__ = ('recipient_id', 'currency', 'address', 'amount')
+
+    def __init__(self, recipient_id: str, currency: 'plisio.CryptoCurrency', address: str, amount: float):
+        self.recipient_id = recipient_id
+        self.currency = currency
+        self.address = address
+        self.amount = amount
+
+    def __repr__(self):
+        return f'<Payout {self.recipient_id}: {self.amount} {getattr(self.currency, "name", self.currency)} to {self.address}>'
+
+
+class PayoutOutcome:
+    """
+    Ledger record of a payout.
+    withdraw_id is set for paid payouts, error for failed and invalid ones.
+    A pending payout was sent, but its result is unknown and has to be checked before paying it again.
+    """
+    __slots__ = ('payout', 'status', 'batch_id', 'withdraw_id', 'error')
+
+    def __init__(
+            self,
+            payout: 'Payout',
+            status: 'plisio.PayoutStatus',
+            batch_id: Optional[str] = None,
+            withdraw_id: Optional[str] = None,
+            error: Optional[str] = None,
+    ):
+        self.payout = payout
+        self.status = status
+        self.batch_id = batch_id
+        self.withdraw_id = withdraw_id
+        self.error = error
+
+    def __repr__(self):
+        return f'<PayoutOutcome {self.payout.recipient_id}: {self.status.name}' + (f' ({self.error})>' if self.error else '>')
+
+
+class PayoutEngine:
+    """
+    Pays many recipients with mass withdrawals of PlisioClient.
+    Payouts are validated, grouped by currency and split into batches of batch_size.
+    Each batch is estimated by get_commission and sent as one withdrawal, up to concurrency batches at once.
+    Outcomes are kept in a SQLite ledger: a repeated run skips paid and pending payouts and retries the failed ones.
+    A withdrawal fails only on rejected_errors; after other errors it may have been made, so its payouts stay pending.
+    """
+    rejected_errors = (
+        plisio.BadRequestError,
+        plisio.UnauthorizedError,
+        plisio.ForbiddenError,
+        plisio.NotFoundError,
+        plisio.MethodNotAllowedError,
+        plisio.NotAcceptableError,
+        plisio.UnsupportedMediaTypeError,
+        plisio.UnprocessableEntityTypeError,
+        plisio.RateLimitReachedError,
+    )
+
+    def __init__(
+            self,
+            client: 'plisio.PlisioClient',
+            path: str,
+            batch_size: int = 100,
+            concurrency: int = 4,
+            fee_plan: Optional['plisio.PlanName'] = None,
+            max_fee: Optional[float] = None,
+            estimate: bool = True,
+            timeout: float = 30,
+            quotes: Optional['plisio.FeeQuoteCache'] = None,
+            quote_max_age: Optional[float] = None,
+    ):
+        """
+        A batch whose estimated fee is above max_fee, or whose total is above the max_amount of the estimate,
+        fails without being sent. With estimate=False batches are sent without estimation.
+        With quotes, batches are estimated by quotes no older than quote_max_age (the ttl of quotes by default).
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be positive')
+        self.client = client
+        self.path = path
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.fee_plan = fee_plan
+        self.max_fee = max_fee
+        self.estimate = estimate
+        self.timeout = timeout
+        self.quotes = quotes
+        self.quote_max_age = quote_max_age
+
+        self.__database = _SQLiteDatabase(path, timeout)
+        self.__database.execute(
+            'CREATE TABLE IF NOT EXISTS plisio_payouts '
+            '(recipient_id TEXT PRIMARY KEY, currency TEXT NOT NULL, address TEXT NOT NULL, amount TEXT NOT NULL, '
+            'status TEXT NOT NULL, batch_id TEXT, withdraw_id TEXT, error TEXT, updated_at REAL NOT NULL)'
+        )
+
+    @staticmethod
+    def __amount(amount: float) -> str:
+        return "{:.8f}".format(amount)
+
+    def ledger(self) -> Dict[str, 'PayoutOutcome']:
+        """
+        All recorded outcomes by recipient_id
+        """
+        rows = self.__database.execute(
+            'SELECT recipient_id, currency, address, amount, status, batch_id, withdraw_id, error FROM plisio_payouts'
+        )
+        return {
+            recipient_id: PayoutOutcome(
+                Payout(recipient_id, plisio.CryptoCurrency[currency], address, float(amount)),
+                plisio.PayoutStatus[status],
+                batch_id,
+                withdraw_id,
+                error,
+            )
+            for recipient_id, currency, address, amount, status, batch_id, withdraw_id, error in rows
+        }
+
+    def __record(self, outcomes: List['PayoutOutcome']) -> List['PayoutOutcome']:
+        now = time.time()
+        with self.__database.transaction() as connection:
+            connection.executemany(
+                'INSERT OR REPLACE INTO plisio_payouts '
+                '(recipient_id, currency, address, amount, status, batch_id, withdraw_id, error, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                [
+                    (
+                        o.payout.recipient_id,
+                        o.payout.currency.name,
+                        o.payout.address,
+                        self.__amount(o.payout.amount),
+                        o.status.name,
+                        o.batch_id,
+                        o.withdraw_id,
+                        o.error,
+                        now,
+                    )
+                    for o in outcomes
+                ],
+            )
+        return outcomes
+
+    def resolve(self, recipient_id: str, paid: bool, withdraw_id: Optional[str] = None):
+        """
+        Settle a pending payout after checking it: paid, or failed to be paid again on the next run
+        """
+        self.__database.execute(
+            'UPDATE plisio_payouts SET status = ?, withdraw_id = COALESCE(?, withdraw_id), updated_at = ? '
+            'WHERE recipient_id = ? AND status = ?',
+            (
+                (plisio.PayoutStatus.paid if paid else plisio.PayoutStatus.failed).name,
+                withdraw_id,
+                time.time(),
+                recipient_id,
+                plisio.PayoutStatus.pending.name,
+            ),
+        )
+
+    def close(self):
+        """
+        Close the ledger connections
+        """
+        self.__database.close()
+
+    @staticmethod
+    def validate(payout: 'Payout') -> Optional[str]:
+        """
+        Why the payout can not be sent, or None
+        """
+        if not isinstance(payout.currency, plisio.CryptoCurrency):
+            return 'Unknown currency'
+        if not isinstance(payout.address, str) or not payout.address or any(c in payout.address for c in ', \t\n'):
+            return 'Invalid address'
+        try:
+            amount = float(payout.amount)
+        except (TypeError, ValueError):
+            return 'Invalid amount'
+        if not math.isfinite(amount) or amount <= 0:
+            return 'Invalid amount'
+        return None
+
+    def plan(self, payouts: Iterable['Payout']) -> Tuple[List[List['Payout']], List[Optional['PayoutOutcome']]]:
+        """
+        Batches to send, and the outcomes known without sending in the order of the payouts:
+        invalid payouts and the ledger records, None for the payouts in the batches
+        """
+        ledger = self.ledger()
+        outcomes = []
+        recipient_ids = set()
+        groups: Dict['plisio.CryptoCurrency', List['Payout']] = OrderedDict()
+        for payout in payouts:
+            error = self.validate(payout)
+            if error is None and payout.recipient_id in recipient_ids:
+                error = 'Duplicate recipient_id'
+            recorded = ledger.get(payout.recipient_id)
+            if error is None and recorded is not None and (
+                    recorded.payout.currency,
+                    recorded.payout.address,
+                    self.__amount(recorded.payout.amount),
+            ) != (payout.currency, payout.address, self.__amount(payout.amount)):
+                error = 'Payout differs from the ledger'
+            recipient_ids.add(payout.recipient_id)
+            if error is not None:
+                outcomes.append(PayoutOutcome(payout, plisio.PayoutStatus.invalid, error=error))
+            elif recorded is not None and recorded.status in (plisio.PayoutStatus.paid, plisio.PayoutStatus.pending):
+                outcomes.append(recorded)
+            else:
+                outcomes.append(None)
+                groups.setdefault(payout.currency, []).append(payout)
+        batches = [
+            group[i:i + self.batch_size]
+            for group in groups.values()
+            for i in range(0, len(group), self.batch_size)
+        ]
+        return batches, outcomes
+
+    def run(self, payouts: Iterable['Payout']) -> List['PayoutOutcome']:
+        """
+        Send the payouts and return their outcomes in the same order
+        """
+        payouts = list(payouts)
+        batches, outcomes = self.plan(payouts)
+        futures = self.client.map([partial(self.__pay, batch) for batch in batches], self.concurrency)
+        sent = {}
+        for future in futures:
+            for outcome in future.result():
+                sent[outcome.payout.recipient_id] = outcome
+        return [outcome or sent[payout.recipient_id] for payout, outcome in zip(payouts, outcomes)]
+
+    def _estimate(
+            self,
+            currency: 'plisio.CryptoCurrency',
+            addresses: List[str],
+            amounts: List[float],
+    ) -> 'plisio.Commission':
+        type_ = plisio.OperationType.mass_cash_out if len(addresses) > 1 else plisio.OperationType.cash_out
+        if self.quotes is not None:
+            return self.quotes.get_commission(
+                currency,
+                addresses,
+                amounts,
+                type_=type_,
+                fee_plan=self.fee_plan,
+                max_age=self.quote_max_age,
+            )
+        return self.client.get_commission(currency, addresses, amounts, type_=type_, fee_plan=self.fee_plan)
+
+    def __check_estimate(self, commission: 'plisio.Commission', amounts: List[float]) -> Optional[str]:
+        if self.max_fee is not None and commission.fee is not None and commission.fee > self.max_fee:
+            return f'Estimated fee {commission.fee} is above {self.max_fee}'
+        if commission.max_amount is not None and sum(amounts) > commission.max_amount:
+            return f'Total {sum(amounts)} is above the available {commission.max_amount}'
+        return None
+
+    def __pay(self, batch: List['Payout']) -> List['PayoutOutcome']:
+        batch_id = uuid.uuid4().hex
+        currency = batch[0].currency
+        addresses = [payout.address for payout in batch]
+        amounts = [float(payout.amount) for payout in batch]
+
+        def outcomes(status: 'plisio.PayoutStatus', withdraw_id: Optional[str] = None, error: Optional[str] = None):
+            return self.__record([PayoutOutcome(payout, status, batch_id, withdraw_id, error) for payout in batch])
+
+        if self.estimate:
+            try:
+                error = self.__check_estimate(self._estimate(currency, addresses, amounts), amounts)
+            except plisio.PlisioError as e:
+                error = f'Estimation failed: {e}'
+            if error is not None:
+                return outcomes(plisio.PayoutStatus.failed, error=error)
+
+        outcomes(plisio.PayoutStatus.pending)
+        try:
+            withdraw = self.client.withdraw(
+                currency,
+                addresses if len(batch) > 1 else addresses[0],
+                amounts if len(batch) > 1 else amounts[0],
+                type_=plisio.OperationType.mass_cash_out if len(batch) > 1 else plisio.OperationType.cash_out,
+                fee_plan=self.fee_plan,
+            )
+        except self.rejected_errors as e:
+            return outcomes(plisio.PayoutStatus.failed, error=str(e))
+        except Exception as e:
+            return outcomes(plisio.PayoutStatus.pending, error=str(e.__cause__ or e))
+        return outcomes(plisio.PayoutStatus.paid, withdraw_id=withdraw.id)
@@ -0,0 +1,230 @@
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple, Union
+
+import asyncio
+import heapq
+import itertools
+import time
+
+import plisio
+
+
+class InvoiceStatusEvent:
+    """
+    Status of a tracked invoice has changed; previous_status is None on the first check
+    """
+
+    def __init__(
+            self,
+            invoice_id: str,
+            previous_status: Optional['plisio.OperationStatus'],
+            status: Optional['plisio.OperationStatus'],
+            operation: 'plisio.Operation',
+    ):
+        self.invoice_id = invoice_id
+        self.previous_status = previous_status
+        self.status = status
+        self.operation = operation
+
+    def __repr__(self):
+        return '<' + f'{super().__repr__()}: ' + f'{self.invoice_id} {self.previous_status} -> {self.status}' + '>'
+
+
+class _TrackedInvoice:
+    __slots__ = ('invoice_id', 'status', 'expire_at', 'unchanged', 'errors', 'due')
+
+    def __init__(self, invoice_id: str, status: Optional['plisio.OperationStatus'], expire_at: Optional[float]):
+        self.invoice_id = invoice_id
+        self.status = status
+        self.expire_at = expire_at
+        self.unchanged = 0
+        self.errors = 0
+        self.due = 0.0
+
+
+class InvoicePoller:
+    """
+    Polls /operations/{id} of open invoices and yields their status changes.
+    Invoices are kept in a heap by the time of their next check. The interval depends on the status
+    and grows while the status does not change; a new invoice is also checked right after it expires.
+    Invoices leave the poller in a terminal status. All checks share one budget of rate calls per second.
+    A check that fails with any error is repeated after a delay that doubles with each failure.
+    """
+    terminal_statuses = frozenset({
+        plisio.OperationStatus.completed,
+        plisio.OperationStatus.expired,
+        plisio.OperationStatus.mismatch,
+        plisio.OperationStatus.error,
+        plisio.OperationStatus.cancelled,
+        plisio.OperationStatus.cancelled_duplicate,
+    })
+    default_intervals = {
+        plisio.OperationStatus.new: 30,
+        plisio.OperationStatus.pending: 10,
+    }
+
+    def __init__(
+            self,
+            client: 'plisio.PlisioAioClient',
+            rate: float = 5,
+            concurrency: int = 10,
+            intervals: Optional[Dict['plisio.OperationStatus', float]] = None,
+            default_interval: float = 30,
+            backoff: float = 1.5,
+            max_interval: float = 600,
+            expiry_grace: float = 5,
+            keep_alive: bool = False,
+    ):
+        """
+        intervals are the first delays in seconds between checks by status, default_interval for the rest.
+        Each check without a change multiplies the delay by backoff, up to max_interval.
+        Iteration ends when no invoice is tracked, or with keep_alive when close() is called.
+        """
+        self.client = client
+        self.budget = plisio.AioTokenBucket(rate)
+        self.concurrency = concurrency
+        self.intervals = dict(self.default_intervals if intervals is None else intervals)
+        self.default_interval = default_interval
+        self.backoff = backoff
+        self.max_interval = max_interval
+        self.expiry_grace = expiry_grace
+        self.keep_alive = keep_alive
+
+        self.checks = 0
+        self.failed = 0
+
+        self.__tracked: Dict[str, _TrackedInvoice] = {}
+        self.__heap: List[Tuple[float, int, str]] = []
+        self.__counter = itertools.count()
+        self.__wakeup = asyncio.Event()
+        self.__closed = False
+
+    def __len__(self) -> int:
+        return len(self.__tracked)
+
+    def __contains__(self, invoice_id: str) -> bool:
+        return invoice_id in self.__tracked
+
+    def track(
+            self,
+            invoice_id: str,
+            status: Optional['plisio.OperationStatus'] = None,
+            expire_at_utc: Optional[int] = None,
+    ):
+        """
+        Start polling the invoice (its txn_id); with a known status there is no event until it changes
+        """
+        if invoice_id in self.__tracked or status in self.terminal_statuses:
+            return
+        entry = self.__tracked[invoice_id] = _TrackedInvoice(invoice_id, status, expire_at_utc)
+        self.__schedule(entry, 0 if status is None else self.__interval(entry))
+
+    def untrack(self, invoice_id: str):
+        self.__tracked.pop(invoice_id, None)
+
+    def close(self):
+        self.__closed = True
+        self.__wakeup.set()
+
+    def __schedule(self, entry: _TrackedInvoice, delay: float):
+        entry.due = time.monotonic() + delay
+        heapq.heappush(self.__heap, (entry.due, next(self.__counter), entry.invoice_id))
+        self.__wakeup.set()
+
+    def __interval(self, entry: _TrackedInvoice) -> float:
+        if entry.errors:
+            return min(self.max_interval, self.intervals.get(entry.status, self.default_interval) * 2 ** entry.errors)
+        interval = self.intervals.get(entry.status, self.default_interval) * self.backoff ** entry.unchanged
+        interval = min(self.max_interval, interval)
+        if entry.expire_at is not None and entry.status in (None, plisio.OperationStatus.new):
+            until_expiry = entry.expire_at + self.expiry_grace - time.time()
+            if until_expiry > 0:
+                interval = min(interval, until_expiry)
+        return interval
+
+    def __pop_due(self) -> Optional[_TrackedInvoice]:
+        now = time.monotonic()
+        while self.__heap and self.__heap[0][0] <= now:
+            due, _, invoice_id = heapq.heappop(self.__heap)
+            entry = self.__tracked.get(invoice_id)
+            if entry is not None and entry.due == due:
+                return entry
+        return None
+
+    def __next_due(self) -> Optional[float]:
+        while self.__heap:
+            due, _, invoice_id = self.__heap[0]
+            entry = self.__tracked.get(invoice_id)
+            if entry is not None and entry.due == due:
+                return due
+            heapq.heappop(self.__heap)
+        return None
+
+    async def __check(self, invoice_id: str) -> Tuple[str, Union['plisio.Operation', Exception]]:
+        try:
+            return invoice_id, await self.client.get_operation(invoice_id)
+        except Exception as e:
+            return invoice_id, e
+
+    def __handle(
+            self,
+            invoice_id: str,
+            result: Union['plisio.Operation', Exception],
+    ) -> Optional[InvoiceStatusEvent]:
+        entry = self.__tracked.get(invoice_id)
+        if entry is None:
+            return None
+        if isinstance(result, Exception):
+            self.failed += 1
+            entry.errors += 1
+            self.__schedule(entry, self.__interval(entry))
+            return None
+        entry.errors = 0
+        event = None
+        if result.status != entry.status:
+            event = InvoiceStatusEvent(invoice_id, entry.status, result.status, result)
+            entry.status = result.status
+            entry.unchanged = 0
+        else:
+            entry.unchanged += 1
+        if result.expire_at_utc:
+            entry.expire_at = result.expire_at_utc
+        if entry.status in self.terminal_statuses:
+            del self.__tracked[invoice_id]
+        else:
+            self.__schedule(entry, self.__interval(entry))
+        return event
+
+    async def __aiter__(self) -> AsyncIterator[InvoiceStatusEvent]:
+        running: Set[asyncio.Future] = set()
+        try:
+            while not self.__closed and (self.__tracked or running or self.keep_alive):
+                while len(running) < self.concurrency:
+                    entry = self.__pop_due()
+                    if entry is None:
+                        break
+                    await self.budget.acquire()
+                    self.checks += 1
+                    running.add(asyncio.ensure_future(self.__check(entry.invoice_id)))
+
+                self.__wakeup.clear()
+                next_due = self.__next_due()
+                timeout = None if next_due is None else max(0.0, next_due - time.monotonic())
+                if len(running) >= self.concurrency:
+                    timeout = None
+                wakeup = asyncio.ensure_future(self.__wakeup.wait())
+                try:
+                    done, _ = await asyncio.wait(
+                        running | {wakeup},
+                        timeout=timeout,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                finally:
+                    wakeup.cancel()
+                for task in done - {wakeup}:
+                    running.discard(task)
+                    event = self.__handle(*task.result())
+                    if event is not None:
+                        yield event
+        finally:
+            for task in running:
+                task.cancel()
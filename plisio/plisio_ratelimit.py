@@ -0,0 +1,134 @@
+from typing import Dict, Optional, Tuple
+
+import asyncio
+import threading
+import time
+
+from .plisio_sqlite import _SQLiteDatabase
+
+
+class RateLimitBackend:
+    """
+    Storage of token buckets.
+    reserve takes tokens from a bucket, possibly going into debt,
+    and returns the seconds to wait until the taken tokens are refilled.
+    """
+
+    def reserve(self, key: str, rate: float, capacity: float, tokens: float = 1) -> float:
+        raise NotImplementedError()
+
+    @staticmethod
+    def _take(
+            available: Optional[float],
+            elapsed: float,
+            rate: float,
+            capacity: float,
+            tokens: float,
+    ) -> Tuple[float, float]:
+        if available is None:
+            available = capacity
+        else:
+            available = min(capacity, available + elapsed * rate)
+        available -= tokens
+        return available, max(0.0, -available / rate)
+
+
+class LocalRateLimitBackend(RateLimitBackend):
+    """
+    Buckets in the memory of the current process, shared by its threads
+    """
+
+    def __init__(self):
+        self.__buckets: Dict[str, Tuple[float, float]] = {}
+        self.__lock = threading.Lock()
+
+    def reserve(self, key: str, rate: float, capacity: float, tokens: float = 1) -> float:
+        with self.__lock:
+            now = time.monotonic()
+            available, updated_at = self.__buckets.get(key, (None, now))
+            available, wait = self._take(available, now - updated_at, rate, capacity, tokens)
+            self.__buckets[key] = (available, now)
+        return wait
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """
+    Buckets in a SQLite database, shared by all processes that use the same file
+    """
+
+    def __init__(self, path: str, timeout: float = 30):
+        self.path = path
+        self.timeout = timeout
+        self.__database = _SQLiteDatabase(path, timeout)
+        self.__database.execute(
+            'CREATE TABLE IF NOT EXISTS plisio_rate_limit '
+            '(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)'
+        )
+
+    def reserve(self, key: str, rate: float, capacity: float, tokens: float = 1) -> float:
+        with self.__database.transaction() as connection:
+            row = connection.execute(
+                'SELECT tokens, updated_at FROM plisio_rate_limit WHERE key = ?',
+                (key,),
+            ).fetchone()
+            now = time.time()
+            available, updated_at = row if row is not None else (None, now)
+            available, wait = self._take(available, max(0.0, now - updated_at), rate, capacity, tokens)
+            connection.execute(
+                'INSERT OR REPLACE INTO plisio_rate_limit (key, tokens, updated_at) VALUES (?, ?, ?)',
+                (key, available, now),
+            )
+        return wait
+
+    def close(self):
+        """
+        Close the database connections
+        """
+        self.__database.close()
+
+
+class _BaseTokenBucket:
+    def __init__(
+            self,
+            rate: float,
+            capacity: Optional[float] = None,
+            key: str = 'plisio',
+            backend: Optional['RateLimitBackend'] = None,
+    ):
+        """
+        rate - tokens refilled per second, capacity - the largest burst (rate by default).
+        Buckets with the same key and backend share one budget.
+        """
+        self.rate = rate
+        self.capacity = max(1.0, rate) if capacity is None else capacity
+        self.key = key
+        self.backend = LocalRateLimitBackend() if backend is None else backend
+
+    def _reserve(self, tokens: float) -> float:
+        return self.backend.reserve(self.key, self.rate, self.capacity, tokens)
+
+
+class TokenBucket(_BaseTokenBucket):
+    """
+    Thread-safe token bucket for PlisioClient
+    """
+
+    def acquire(self, tokens: float = 1):
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+
+class AioTokenBucket(_BaseTokenBucket):
+    """
+    Token bucket for PlisioAioClient, shared by coroutines.
+    Backends other than LocalRateLimitBackend are called off the event loop.
+    """
+
+    async def acquire(self, tokens: float = 1):
+        if isinstance(self.backend, LocalRateLimitBackend):
+            wait = self._reserve(tokens)
+        else:
+            wait = await asyncio.get_event_loop().run_in_executor(None, self._reserve, tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
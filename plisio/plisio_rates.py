@@ -0,0 +1,218 @@
+from typing import Dict, Iterable, Optional, Tuple
+from array import array
+
+import asyncio
+import logging
+import statistics
+import threading
+import time
+
+import plisio
+
+
+logger = logging.getLogger(__name__)
+
+
+class RateTable:
+    """
+    Exchange rates of get_currencies, indexed by fiat and cryptocurrency.
+    fiat_rate is the amount of cryptocurrency for 1 fiat and rate_usd for 1 USD,
+    so a fiat without its own rates is converted through USD.
+    A table is not changed after it is built; RateTableRefresher replaces it as a whole.
+    """
+
+    def __init__(self, currencies: Iterable['plisio.Currency'], fiat: Optional['plisio.FiatCurrency'] = None):
+        """
+        currencies may hold the lists of several fiats; fiat is the default one, the fiat of the first currency
+        """
+        self.__rates: Dict[Tuple['plisio.FiatCurrency', 'plisio.CryptoCurrency'], 'plisio.Currency'] = {}
+        self.__currencies: Dict['plisio.CryptoCurrency', 'plisio.Currency'] = {}
+        usd_per_fiat = {}
+        for currency in currencies:
+            if currency.currency is None:
+                continue
+            if fiat is None:
+                fiat = currency.fiat
+            self.__rates[(currency.fiat, currency.currency)] = currency
+            self.__currencies[currency.currency] = currency
+            if currency.fiat is not None and currency.fiat_rate and currency.rate_usd:
+                usd_per_fiat.setdefault(currency.fiat, []).append(currency.fiat_rate / currency.rate_usd)
+        self.fiat = fiat or plisio.FiatCurrency.USD
+        self.usd_per_fiat: Dict['plisio.FiatCurrency', float] = {
+            fiat_: statistics.median(ratios) for fiat_, ratios in usd_per_fiat.items()
+        }
+        self.usd_per_fiat[plisio.FiatCurrency.USD] = 1.0
+        self.created_at = time.time()
+
+    @classmethod
+    def from_client(
+            cls,
+            client: 'plisio.PlisioClient',
+            fiats: Iterable['plisio.FiatCurrency'] = (plisio.FiatCurrency.USD,),
+    ) -> 'RateTable':
+        fiats = list(fiats)
+        return cls([currency for fiat in fiats for currency in client.get_currencies(fiat)], fiats[0])
+
+    @classmethod
+    async def afrom_client(
+            cls,
+            client: 'plisio.PlisioAioClient',
+            fiats: Iterable['plisio.FiatCurrency'] = (plisio.FiatCurrency.USD,),
+    ) -> 'RateTable':
+        fiats = list(fiats)
+        lists = await asyncio.gather(*[client.get_currencies(fiat) for fiat in fiats])
+        return cls([currency for currencies in lists for currency in currencies], fiats[0])
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.created_at
+
+    def __len__(self) -> int:
+        return len(self.__currencies)
+
+    def __contains__(self, crypto: 'plisio.CryptoCurrency') -> bool:
+        return crypto in self.__currencies
+
+    def __getitem__(self, crypto: 'plisio.CryptoCurrency') -> 'plisio.Currency':
+        """
+        Currency of the default fiat, or of any fiat if the default one has no rate for it
+        """
+        return self.__rates.get((self.fiat, crypto)) or self.__currencies[crypto]
+
+    def rate_usd(self, crypto: 'plisio.CryptoCurrency') -> float:
+        return self.__currencies[crypto].rate_usd
+
+    def precision(self, crypto: 'plisio.CryptoCurrency') -> Optional[int]:
+        return self.__currencies[crypto].precision
+
+    def min_sum_in(self, crypto: 'plisio.CryptoCurrency') -> Optional[float]:
+        return self.__currencies[crypto].min_sum_in
+
+    def fiat_rate(self, crypto: 'plisio.CryptoCurrency', fiat: Optional['plisio.FiatCurrency'] = None) -> float:
+        """
+        Amount of the cryptocurrency for 1 fiat, through USD if the table has no rate of the fiat itself
+        """
+        fiat = fiat or self.fiat
+        currency = self.__rates.get((fiat, crypto))
+        if currency is not None and currency.fiat_rate:
+            return currency.fiat_rate
+        rate_usd = self.__currencies[crypto].rate_usd
+        if not rate_usd:
+            raise KeyError(crypto)
+        return self.usd_per_fiat[fiat] * rate_usd
+
+    def to_crypto(
+            self,
+            amount: float,
+            crypto: 'plisio.CryptoCurrency',
+            fiat: Optional['plisio.FiatCurrency'] = None,
+            rounded: bool = False,
+    ) -> float:
+        """
+        Fiat amount in the cryptocurrency, rounded to its precision if asked
+        """
+        value = amount * self.fiat_rate(crypto, fiat)
+        precision = self.precision(crypto) if rounded else None
+        return round(value, precision) if precision is not None else value
+
+    def to_crypto_many(
+            self,
+            amounts: Iterable[float],
+            crypto: 'plisio.CryptoCurrency',
+            fiat: Optional['plisio.FiatCurrency'] = None,
+    ) -> array:
+        """
+        Many fiat amounts in the cryptocurrency at once, as an array of doubles.
+        A numpy array can be multiplied by fiat_rate(crypto, fiat) directly.
+        """
+        return array('d', map(self.fiat_rate(crypto, fiat).__mul__, amounts))
+
+    def to_fiat(
+            self,
+            amount: float,
+            crypto: 'plisio.CryptoCurrency',
+            fiat: Optional['plisio.FiatCurrency'] = None,
+    ) -> float:
+        return amount / self.fiat_rate(crypto, fiat)
+
+    def convert_fiat(
+            self,
+            amount: float,
+            from_fiat: 'plisio.FiatCurrency',
+            to_fiat: Optional['plisio.FiatCurrency'] = None,
+    ) -> float:
+        return amount * self.usd_per_fiat[from_fiat] / self.usd_per_fiat[to_fiat or self.fiat]
+
+
+class RateTableRefresher:
+    """
+    Keeps a fresh RateTable of the fiats, requesting their rates again every interval seconds.
+    A new table replaces the old one at once, so readers see either of them whole.
+    """
+
+    def __init__(
+            self,
+            client: 'plisio.PlisioClient',
+            fiats: Iterable['plisio.FiatCurrency'] = (plisio.FiatCurrency.USD,),
+            interval: float = 60,
+    ):
+        self.client = client
+        self.fiats = tuple(fiats)
+        self.interval = interval
+        self.table: Optional['RateTable'] = None
+
+        self.__stopped = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+
+    def refresh(self) -> 'RateTable':
+        self.table = RateTable.from_client(self.client, self.fiats)
+        return self.table
+
+    async def arefresh(self) -> 'RateTable':
+        """
+        refresh with PlisioAioClient
+        """
+        self.table = await RateTable.afrom_client(self.client, self.fiats)
+        return self.table
+
+    def start(self):
+        """
+        Load the table and start the refresher thread
+        """
+        if self.__thread is not None:
+            return
+        self.refresh()
+        self.__stopped.clear()
+        self.__thread = threading.Thread(target=self.__refresh_forever, name='plisio-rates', daemon=True)
+        self.__thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        self.__stopped.set()
+        if self.__thread is not None:
+            self.__thread.join(timeout)
+            self.__thread = None
+
+    def __enter__(self) -> 'RateTableRefresher':
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def __refresh_forever(self):
+        while not self.__stopped.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception('Plisio rates refresh failed')
+
+    async def arefresh_forever(self):
+        """
+        Refresh loop of PlisioAioClient, to be run as a task
+        """
+        while True:
+            try:
+                await self.arefresh()
+            except Exception:
+                logger.exception('Plisio rates refresh failed')
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,78 @@
+from typing import Optional
+from email.utils import parsedate_to_datetime
+
+import datetime
+import random
+import threading
+
+
+class RetryPolicy:
+    """
+    Retries of requests that failed with a connection error or one of retry_statuses.
+    The delay before an attempt is exponential with full jitter, capped by max_delay;
+    Retry-After of the response is honored when present.
+    Only idempotent requests are retried unless retry_non_idempotent is set.
+    """
+    retry_statuses = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+            self,
+            max_attempts: int = 3,
+            base_delay: float = 0.5,
+            max_delay: float = 30,
+            jitter: bool = True,
+            respect_retry_after: bool = True,
+            retry_non_idempotent: bool = False,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.retry_non_idempotent = retry_non_idempotent
+
+        self.retries = 0
+        self.backoff_time = 0.0
+        self.__lock = threading.Lock()
+
+    def should_retry(self, request: 'plisio.plisio_client._PlisioRequest', attempt: int, status: Optional[int] = None) -> bool:
+        """
+        Whether the request is sent again after the attempt,
+        which failed with the status or with a connection error if status is None
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if not (request.idempotent or self.retry_non_idempotent):
+            return False
+        return status is None or status in self.retry_statuses
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Seconds to wait before the next attempt; counted in the retry statistics
+        """
+        delay = None
+        if self.respect_retry_after and retry_after:
+            delay = self.__parse_retry_after(retry_after)
+        if delay is None:
+            delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+            if self.jitter:
+                delay = random.uniform(0, delay)
+        delay = min(max(delay, 0.0), self.max_delay)
+        with self.__lock:
+            self.retries += 1
+            self.backoff_time += delay
+        return delay
+
+    @staticmethod
+    def __parse_retry_after(retry_after: str) -> Optional[float]:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass
+        try:
+            date = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=datetime.timezone.utc)
+        return (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
@@ -0,0 +1,58 @@
+from typing import Any, Iterable, Iterator, List
+from contextlib import contextmanager
+
+import sqlite3
+import threading
+
+
+class _SQLiteDatabase:
+    """
+    SQLite file with one autocommit connection per thread.
+    close() closes the connections of all threads; they are opened again on the next use.
+    """
+
+    def __init__(self, path: str, timeout: float = 30):
+        self.path = path
+        self.timeout = timeout
+
+        self.__local = threading.local()
+        self.__connections: List[sqlite3.Connection] = []
+        self.__lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        connection = getattr(self.__local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self.__local.connection = connection
+            with self.__lock:
+                self.__connections.append(connection)
+        return connection
+
+    def execute(self, sql: str, parameters: Iterable[Any] = ()) -> sqlite3.Cursor:
+        return self.connection().execute(sql, parameters)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Connection of the thread in a write transaction, committed unless the block raises
+        """
+        connection = self.connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            yield connection
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+
+    def close(self):
+        with self.__lock:
+            connections, self.__connections = self.__connections, []
+            self.__local = threading.local()
+        for connection in connections:
+            connection.close()
@@ -0,0 +1,364 @@
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+import asyncio
+import inspect
+import json
+
+import plisio
+
+
+# asyncio.get_running_loop is new in Python 3.7, get_event_loop returns the same loop inside a coroutine
+_get_running_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+
+
+class TransportResponse:
+    """
+    Response of a transport: status, headers and body.
+    redirect_url is the final url when redirects were followed, and then the body is not read.
+    """
+    __slots__ = ('status', 'headers', 'content', 'redirect_url')
+
+    def __init__(
+            self,
+            status: int,
+            headers: Optional[Mapping[str, str]] = None,
+            content: bytes = b'',
+            redirect_url: Optional[str] = None,
+    ):
+        self.status = status
+        self.headers = headers if headers is not None else {}
+        self.content = content
+        self.redirect_url = redirect_url
+
+    def __repr__(self):
+        return f'<TransportResponse {self.status}' + (f' -> {self.redirect_url}>' if self.redirect_url else '>')
+
+
+class Transport:
+    """
+    Sends requests of PlisioClient.
+    send follows redirects and raises TransportError when the request could not be made.
+    """
+
+    def send(self, method: str, url: str, params: Dict[str, Any]) -> 'TransportResponse':
+        raise NotImplementedError()
+
+    def close(self):
+        pass
+
+
+class AioTransport:
+    """
+    Sends requests of PlisioAioClient, see Transport
+    """
+
+    async def send(self, method: str, url: str, params: Dict[str, Any]) -> 'TransportResponse':
+        raise NotImplementedError()
+
+    async def close(self):
+        pass
+
+
+class RequestsTransport(Transport):
+    """
+    requests.Session with a connection pool, shared by all calls and threads.
+    A passed session is used as is and is not closed by the transport.
+    """
+
+    def __init__(
+            self,
+            session: Optional['requests.Session'] = None,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            timeout: Optional[float] = None,
+    ):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.timeout = timeout
+        self._own_session = session is None
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        self.session = session
+
+    def send(self, method: str, url: str, params: Dict[str, Any]) -> 'TransportResponse':
+        import requests
+
+        try:
+            _req = self.session.request(method, url, params=params, timeout=self.timeout)
+            if _req.history:
+                _req.close()
+                return TransportResponse(_req.status_code, _req.headers, redirect_url=_req.url)
+            return TransportResponse(_req.status_code, _req.headers, _req.content)
+        except requests.exceptions.RequestException as re:
+            raise plisio.TransportError() from re
+
+    def close(self):
+        if self._own_session:
+            self.session.close()
+
+
+class AiohttpTransport(AioTransport):
+    """
+    aiohttp.ClientSession, created on the first request and again when the event loop changes.
+    A passed session is used as is and is not closed by the transport.
+    """
+
+    def __init__(
+            self,
+            session: Optional['aiohttp.ClientSession'] = None,
+            limit: int = 100,
+            limit_per_host: int = 0,
+            ttl_dns_cache: Optional[int] = 10,
+            keepalive_timeout: float = 15,
+            timeout: Optional[float] = None,
+    ):
+        self.timeout = timeout
+        self._own_session = session is None
+        self._session = session
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__connector_options = {
+            'limit': limit,
+            'limit_per_host': limit_per_host,
+            'ttl_dns_cache': ttl_dns_cache,
+            'keepalive_timeout': keepalive_timeout,
+        }
+
+    @property
+    def session(self) -> 'aiohttp.ClientSession':
+        import aiohttp
+
+        loop = _get_running_loop()
+        if self._own_session and self._session is not None and self.__loop is not loop:
+            self.__release(self._session, self.__loop)
+            self._session = None
+        if self._session is None or self._session.closed:
+            session_options = {}
+            if self.timeout is not None:
+                session_options['timeout'] = aiohttp.ClientTimeout(total=self.timeout)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**self.__connector_options),
+                **session_options,
+            )
+            self._own_session = True
+            self.__loop = loop
+        return self._session
+
+    @staticmethod
+    def __release(session: 'aiohttp.ClientSession', loop: Optional[asyncio.AbstractEventLoop]):
+        """
+        Close a session of another event loop; the connections of a closed loop are just dropped
+        """
+        if loop is None or loop.is_closed():
+            connector = session.connector
+            if connector is not None:
+                # BaseConnector.close is a coroutine in aiohttp 3.x, _close only marks it closed on a closed loop
+                getattr(connector, '_close', connector.close)()
+            session.detach()
+        elif not session.closed:
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+
+    async def send(self, method: str, url: str, params: Dict[str, Any]) -> 'TransportResponse':
+        import aiohttp
+
+        try:
+            async with self.session.request(method, url, params=params) as _req:
+                if _req.history:
+                    return TransportResponse(_req.status, _req.headers, redirect_url=str(_req.url))
+                return TransportResponse(_req.status, _req.headers, await _req.read())
+        except (aiohttp.ClientError, asyncio.TimeoutError, RuntimeError) as ce:
+            raise plisio.TransportError() from ce
+
+    async def close(self):
+        if self._own_session and self._session is not None:
+            if self.__loop is _get_running_loop():
+                await self._session.close()
+            else:
+                self.__release(self._session, self.__loop)
+            self._session = None
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError('httpx is required for this transport: pip install plisio[http2]') from e
+    return httpx
+
+
+def _httpx_options(
+        http2: bool,
+        max_connections: Optional[int],
+        max_keepalive_connections: Optional[int],
+        keepalive_expiry: Optional[float],
+        timeout: Optional[float],
+) -> Dict[str, Any]:
+    httpx = _import_httpx()
+    return {
+        'http2': http2,
+        'limits': httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        'timeout': timeout,
+        'follow_redirects': True,
+    }
+
+
+def _httpx_response(_req: 'httpx.Response') -> 'TransportResponse':
+    if _req.history:
+        return TransportResponse(_req.status_code, _req.headers, redirect_url=str(_req.url))
+    return TransportResponse(_req.status_code, _req.headers, _req.content)
+
+
+class HttpxTransport(Transport):
+    """
+    httpx.Client, by default over HTTP/2, so that calls from many threads
+    are multiplexed over a few connections. Needs plisio[http2].
+    A passed client is used as is and is not closed by the transport.
+    """
+
+    def __init__(
+            self,
+            client: Optional['httpx.Client'] = None,
+            http2: bool = True,
+            max_connections: Optional[int] = 10,
+            max_keepalive_connections: Optional[int] = 10,
+            keepalive_expiry: Optional[float] = 15,
+            timeout: Optional[float] = None,
+    ):
+        httpx = _import_httpx()
+
+        self._own_client = client is None
+        if client is None:
+            client = httpx.Client(**_httpx_options(
+                http2, max_connections, max_keepalive_connections, keepalive_expiry, timeout,
+            ))
+        self.client = client
+
+    def send(self, method: str, url: str, params: Dict[str, Any]) -> 'TransportResponse':
+        httpx = _import_httpx()
+
+        try:
+            return _httpx_response(self.client.request(method, url, params=params))
+        except httpx.HTTPError as he:
+            raise plisio.TransportError() from he
+
+    def close(self):
+        if self._own_client:
+            self.client.close()
+
+
+class AioHttpxTransport(AioTransport):
+    """
+    httpx.AsyncClient, by default over HTTP/2, so that hundreds of concurrent calls
+    share one connection. Needs plisio[http2].
+    A passed client is used as is and is not closed by the transport.
+    """
+
+    def __init__(
+            self,
+            client: Optional['httpx.AsyncClient'] = None,
+            http2: bool = True,
+            max_connections: Optional[int] = 10,
+            max_keepalive_connections: Optional[int] = 10,
+            keepalive_expiry: Optional[float] = 15,
+            timeout: Optional[float] = None,
+    ):
+        httpx = _import_httpx()
+
+        self._own_client = client is None
+        if client is None:
+            client = httpx.AsyncClient(**_httpx_options(
+                http2, max_connections, max_keepalive_connections, keepalive_expiry, timeout,
+            ))
+        self.client = client
+
+    async def send(self, method: str, url: str, params: Dict[str, Any]) -> 'TransportResponse':
+        httpx = _import_httpx()
+
+        try:
+            return _httpx_response(await self.client.request(method, url, params=params))
+        except httpx.HTTPError as he:
+            raise plisio.TransportError() from he
+
+    async def close(self):
+        if self._own_client:
+            await self.client.aclose()
+
+
+FakeResult = Union['TransportResponse', 'plisio.RType', Tuple[int, 'plisio.RType']]
+FakeHandler = Callable[[str, str, Dict[str, Any]], Union[FakeResult, Awaitable[FakeResult]]]
+
+
+class _FakeTransportMixin:
+    def __init__(self, handler: FakeHandler):
+        self.handler = handler
+        self.calls: List[Tuple[str, str, Dict[str, Any]]] = []
+
+    @staticmethod
+    def response(
+            data: 'plisio.RType',
+            status: int = 200,
+            headers: Optional[Mapping[str, str]] = None,
+    ) -> 'TransportResponse':
+        """
+        JSON response with the data
+        """
+        return TransportResponse(status, headers, json.dumps(data).encode('utf8'))
+
+    @staticmethod
+    def redirect(url: str) -> 'TransportResponse':
+        """
+        Response that was redirected to the url, as for an invoice with redirect_to_invoice
+        """
+        return TransportResponse(200, redirect_url=url)
+
+    def _response(self, result: FakeResult) -> 'TransportResponse':
+        if isinstance(result, TransportResponse):
+            return result
+        if isinstance(result, tuple):
+            return self.response(result[1], result[0])
+        return self.response(result)
+
+    def _record(self, method: str, url: str, params: Dict[str, Any]) -> Any:
+        self.calls.append((method, url, dict(params)))
+        try:
+            return self.handler(method, url, dict(params))
+        except (ConnectionError, TimeoutError) as e:
+            raise plisio.TransportError() from e
+
+
+class FakeTransport(_FakeTransportMixin, Transport):
+    """
+    In-memory transport for tests.
+    handler(method, url, params) returns a TransportResponse, a (status, data) tuple or the data
+    of a 200 response; ConnectionError and TimeoutError raised by the handler become TransportError.
+    Every request is recorded in calls.
+    """
+
+    def send(self, method: str, url: str, params: Dict[str, Any]) -> 'TransportResponse':
+        return self._response(self._record(method, url, params))
+
+
+class AioFakeTransport(_FakeTransportMixin, AioTransport):
+    """
+    In-memory transport for tests of PlisioAioClient, see FakeTransport.
+    The handler may also be a coroutine function.
+    """
+
+    async def send(self, method: str, url: str, params: Dict[str, Any]) -> 'TransportResponse':
+        result = self._record(method, url, params)
+        if inspect.isawaitable(result):
+            try:
+                result = await result
+            except (ConnectionError, TimeoutError) as e:
+                raise plisio.TransportError() from e
+        return self._response(result)
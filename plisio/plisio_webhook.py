@@ -0,0 +1,150 @@
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+
+import asyncio
+import logging
+
+import plisio
+
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookEvent:
+    """
+    Verified callback: the raw payload and its model,
+    Invoice for invoice callbacks and Operation for the others
+    """
+
+    def __init__(
+            self,
+            payload: Dict,
+            model: Union['plisio.Invoice', 'plisio.Operation'],
+            status: Optional['plisio.OperationStatus'],
+    ):
+        self.payload = payload
+        self.model = model
+        self.status = status
+
+    @classmethod
+    def from_payload(cls, payload: Dict) -> 'WebhookEvent':
+        if payload.get('ipn_type', 'invoice') == 'invoice' and 'txn_id' in payload:
+            model = plisio.Invoice.from_response(payload)
+        else:
+            model = plisio.Operation.from_response(payload)
+        try:
+            status = payload.get('status') and plisio.OperationStatus[payload['status']]
+        except KeyError:
+            status = None
+        return cls(payload, model, status)
+
+    def __repr__(self):
+        return '<' + f'{super().__repr__()}: ' + str(self.payload) + '>'
+
+
+class WebhookReceiver:
+    """
+    aiohttp.web endpoint for Plisio callbacks (callback_url with ?json=true).
+    A callback is verified and queued, and the response is sent at once;
+    workers then build the events and pass them to the handler.
+    Invalid callbacks get 403, and 503 is returned when the queue is full so that Plisio retries later.
+    Repeated deliveries are acknowledged and dropped by the deduplicator, if given.
+    """
+
+    def __init__(
+            self,
+            api_key: str,
+            handler: Callable[['WebhookEvent'], Awaitable[None]],
+            workers: int = 4,
+            queue_size: int = 10000,
+            path: str = '/plisio/callback',
+            deduplicator: Optional['plisio.CallbackDeduplicator'] = None,
+    ):
+        self.verifier = plisio.CallbackVerifier(api_key)
+        self.deduplicator = deduplicator
+        self.handler = handler
+        self.workers = workers
+        self.queue_size = queue_size
+        self.path = path
+
+        self.received = 0
+        self.rejected = 0
+        self.overflowed = 0
+        self.processed = 0
+        self.failed = 0
+
+        self.__queue: Optional[asyncio.Queue] = None
+        self.__tasks: List[asyncio.Task] = []
+
+    def app(self) -> 'aiohttp.web.Application':
+        """
+        Application that serves only the callback endpoint
+        """
+        from aiohttp import web
+
+        app = web.Application()
+        self.setup(app)
+        return app
+
+    def setup(self, app: 'aiohttp.web.Application'):
+        """
+        Add the callback endpoint and the workers to an existing application
+        """
+        app.router.add_post(self.path, self.handle)
+        app.on_startup.append(self.__on_startup)
+        app.on_cleanup.append(self.__on_cleanup)
+
+    async def __on_startup(self, app: 'aiohttp.web.Application'):
+        await self.start()
+
+    async def __on_cleanup(self, app: 'aiohttp.web.Application'):
+        await self.stop()
+
+    async def start(self):
+        self.__queue = asyncio.Queue(self.queue_size)
+        self.__tasks = [asyncio.ensure_future(self.__work()) for _ in range(self.workers)]
+
+    async def stop(self, timeout: Optional[float] = 10):
+        """
+        Wait up to timeout for the queued callbacks to be handled, then stop the workers
+        """
+        if self.__queue is not None:
+            try:
+                await asyncio.wait_for(self.__queue.join(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning('Plisio callbacks left unprocessed: %d', self.__queue.qsize())
+        for task in self.__tasks:
+            task.cancel()
+        await asyncio.gather(*self.__tasks, return_exceptions=True)
+        self.__tasks = []
+
+    async def handle(self, request: 'aiohttp.web.Request') -> 'aiohttp.web.Response':
+        from aiohttp import web
+
+        self.received += 1
+        payload = self.verifier.load(await request.read())
+        if payload is None:
+            self.rejected += 1
+            return web.Response(status=403, text='Invalid callback')
+        if self.deduplicator is not None and await self.deduplicator.aseen(payload):
+            return web.Response(text='OK')
+        try:
+            self.__queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            self.overflowed += 1
+            if self.deduplicator is not None:
+                await self.deduplicator.adiscard(payload)
+            return web.Response(status=503, text='Try again later')
+        return web.Response(text='OK')
+
+    async def __work(self):
+        while True:
+            payload = await self.__queue.get()
+            try:
+                await self.handler(WebhookEvent.from_payload(payload))
+            except Exception:
+                self.failed += 1
+                logger.exception('Plisio callback handler failed')
+            else:
+                self.processed += 1
+            finally:
+                self.__queue.task_done()
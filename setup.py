@@ -24,6 +24,10 @@ setup(
         'hashlib; python_version <= "3.9"',
         'hmac; python_version <= "3.9"',
     ],
+    extras_require={
+        'orjson': ['orjson'],
+        'http2': ['httpx[http2]'],
+    },
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Topic :: Software Development :: Build Tools',
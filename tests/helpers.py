@@ -0,0 +1,46 @@
+from typing import Any, Dict, List
+
+import asyncio
+
+
+def success(data: Any) -> Dict[str, Any]:
+    return {'status': 'success', 'data': data}
+
+
+def error(message: str) -> Dict[str, Any]:
+    return {'status': 'error', 'data': {'name': 'Error', 'message': message, 'code': 0}, 'message': message}
+
+
+def operation(id_: str, status: str = 'completed', **fields) -> Dict[str, Any]:
+    return {'id': id_, 'type': 'invoice', 'status': status, 'currency': 'BTC', 'amount': '0.1', **fields}
+
+
+def operations_page(page: int, page_count: int, per_page: int = 2, meta: bool = True) -> Dict[str, Any]:
+    """
+    Raw /operations page of page_count pages; pages after the last one are empty
+    """
+    operations = [operation(f'{page}-{i}') for i in range(per_page)] if page <= page_count else []
+    links = {'self': {'href': f'/operations?page={page}'}}
+    if page < page_count:
+        links['next'] = {'href': f'/operations?page={page + 1}'}
+    body = {'operations': operations, '_links': links}
+    if meta:
+        body['_meta'] = {
+            'totalCount': page_count * per_page,
+            'pageCount': page_count,
+            'currentPage': page,
+            'perPage': per_page,
+        }
+    return body
+
+
+def page_ids(first: int, last: int, per_page: int = 2) -> List[str]:
+    return [f'{page}-{i}' for page in range(first, last + 1) for i in range(per_page)]
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
@@ -0,0 +1,43 @@
+import threading
+
+import plisio
+
+from .helpers import error, run, success
+
+
+CURRENCIES = [plisio.CryptoCurrency.BTC, plisio.CryptoCurrency.XMR, plisio.CryptoCurrency.ETH]
+
+
+def balances_handler(method, url, params):
+    if url.endswith('/XMR'):
+        return 422, error('Unsupported')
+    return success({'psys_cid': url.rsplit('/', 1)[1], 'balance': '2'})
+
+
+def test_get_all_balances_skips_failed_currencies():
+    client = plisio.PlisioClient('key', transport=plisio.FakeTransport(balances_handler))
+
+    balances = client.get_all_balances(CURRENCIES)
+    assert list(balances) == [plisio.CryptoCurrency.BTC, plisio.CryptoCurrency.ETH]
+    assert balances[plisio.CryptoCurrency.ETH].balance == 2.0
+    client.close()
+
+
+def test_aio_get_all_balances_skips_failed_currencies():
+    client = plisio.PlisioAioClient('key', transport=plisio.AioFakeTransport(balances_handler))
+
+    assert list(run(client.get_all_balances(CURRENCIES))) == [plisio.CryptoCurrency.BTC, plisio.CryptoCurrency.ETH]
+
+
+def test_submitted_get_all_balances_on_a_busy_pool():
+    entered = threading.Barrier(2)
+
+    def handler(method, url, params):
+        if threading.current_thread().name.startswith('plisio'):
+            entered.wait(5)
+        return balances_handler(method, url, params)
+
+    with plisio.PlisioClient('key', transport=plisio.FakeTransport(handler), max_workers=2) as client:
+        futures = [client.submit(client.get_all_balances, plisio.CryptoCurrency) for _ in range(2)]
+
+        assert [len(future.result(10)) for future in futures] == [len(plisio.CryptoCurrency) - 1] * 2
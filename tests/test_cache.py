@@ -0,0 +1,134 @@
+import asyncio
+import threading
+
+import pytest
+
+import plisio
+
+from .helpers import run, success
+
+
+CURRENCIES = success([{'cid': 'BTC', 'currency': 'BTC', 'rate_usd': '0.00002', 'fiat': 'USD'}])
+BALANCE = success({'psys_cid': 'BTC', 'balance': '1'})
+
+
+def test_response_cache_hits_and_misses():
+    transport = plisio.FakeTransport(lambda method, url, params: CURRENCIES)
+    cache = plisio.ResponseCache()
+    client = plisio.PlisioClient('key', transport=transport, cache=cache)
+
+    for _ in range(3):
+        assert client.get_currencies()[0].currency == plisio.CryptoCurrency.BTC
+    client.get_currencies(plisio.FiatCurrency.EUR)
+
+    assert len(transport.calls) == 2
+    assert (cache.hits, cache.misses, len(cache)) == (2, 2, 2)
+
+
+def test_response_cache_skips_endpoints_without_ttl():
+    transport = plisio.FakeTransport(lambda method, url, params: BALANCE)
+    cache = plisio.ResponseCache()
+    client = plisio.PlisioClient('key', transport=transport, cache=cache)
+
+    client.get_balance(plisio.CryptoCurrency.BTC)
+    client.get_balance(plisio.CryptoCurrency.BTC)
+
+    assert len(transport.calls) == 2
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_response_cache_expires():
+    transport = plisio.FakeTransport(lambda method, url, params: CURRENCIES)
+    cache = plisio.ResponseCache(ttl={'currencies': 0})
+    client = plisio.PlisioClient('key', transport=transport, cache=cache)
+
+    client.get_currencies()
+    client.get_currencies()
+
+    assert len(transport.calls) == 2
+    assert cache.misses == 2
+
+
+def test_response_cache_refuses_non_idempotent_endpoints():
+    with pytest.raises(ValueError):
+        plisio.ResponseCache(ttl={'invoices/new': 10})
+
+
+def test_coalescing_of_concurrent_calls():
+    callers = 8
+    entered = threading.Event()
+    release = threading.Event()
+
+    def handler(method, url, params):
+        entered.set()
+        release.wait(5)
+        return BALANCE
+
+    transport = plisio.FakeTransport(handler)
+    client = plisio.PlisioClient('key', transport=transport, coalesce=True)
+
+    futures = [client.submit(client.get_balance, plisio.CryptoCurrency.BTC)]
+    entered.wait(5)
+    futures += [client.submit(client.get_balance, plisio.CryptoCurrency.BTC) for _ in range(callers - 1)]
+    while client.single_flight.shared < callers - 1:
+        threading.Event().wait(0.001)
+    release.set()
+
+    assert all(future.result().balance == 1.0 for future in futures)
+    assert len(transport.calls) == 1
+    assert (client.single_flight.calls, client.single_flight.shared) == (1, callers - 1)
+    client.close()
+
+
+def test_aio_coalescing_with_the_cache():
+    async def handler(method, url, params):
+        await asyncio.sleep(0.01)
+        return CURRENCIES
+
+    transport = plisio.AioFakeTransport(handler)
+    cache = plisio.ResponseCache()
+    client = plisio.PlisioAioClient('key', transport=transport, cache=cache)
+
+    async def main():
+        await asyncio.gather(*[client.get_currencies() for _ in range(5)])
+        await client.get_currencies()
+
+    run(main())
+    assert len(transport.calls) == 1
+    assert (cache.misses, cache.hits) == (1, 5)
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_call():
+    single_flight = plisio.SingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.02)
+        return 42
+
+    async def main():
+        first = asyncio.ensure_future(single_flight.acall('key', slow))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(single_flight.acall('key', slow))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert run(main()) == 42
+    assert (single_flight.calls, single_flight.shared) == (1, 1)
+
+
+def test_single_flight_shares_exceptions():
+    single_flight = plisio.SingleFlight()
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise plisio.ServiceUnavailableError()
+
+    async def main():
+        return await asyncio.gather(*[single_flight.acall('key', failing) for _ in range(3)], return_exceptions=True)
+
+    results = run(main())
+    assert all(isinstance(result, plisio.ServiceUnavailableError) for result in results)
+    assert (single_flight.calls, single_flight.shared) == (1, 2)
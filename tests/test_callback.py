@@ -0,0 +1,103 @@
+import hashlib
+import hmac
+import json
+
+import pytest
+
+import plisio
+
+from .helpers import run
+
+
+API_KEY = 'secret-key'
+
+PAYLOADS = [
+    {'txn_id': '64d1df01', 'status': 'completed', 'amount': '0.002', 'currency': 'BTC'},
+    {'txn_id': '64d1df02', 'status': 'mismatch', 'amount': 0.1 + 0.2, 'comment': 'Заказ №5 ✓'},
+    {'txn_id': '64d1df03', 'status': 'pending', 'tx_urls': ['a', 'b'], 'params': {'order_number': 1, 'flag': True}},
+    {'txn_id': '64d1df04', 'status': 'new', 'big': 2 ** 70, 'empty': None, 'zero': 0.0},
+]
+
+
+def sign(payload, api_key=API_KEY) -> str:
+    """
+    Callback body as sent by Plisio: the payload with verify_hash of its compact JSON
+    """
+    digest = hmac.new(api_key.encode('utf8'), json.dumps(payload, separators=(',', ':')).encode('utf8'), hashlib.sha1)
+    return json.dumps({**payload, 'verify_hash': digest.hexdigest()})
+
+
+def baseline_validate(api_key, data) -> bool:
+    """
+    validate_callback of plisio 1.0.11
+    """
+    json_obj = json.loads(data)
+    verify_hash = json_obj['verify_hash']
+    del json_obj["verify_hash"]
+    key = bytes(str(api_key), 'utf8')
+    post_str = bytes(json.dumps(json_obj, separators=(',', ':')), 'utf8')
+    return hmac.new(key, post_str, hashlib.sha1).hexdigest() == verify_hash
+
+
+def tampered(body: str) -> str:
+    payload = json.loads(body)
+    payload['status'] = 'completed' if payload['status'] != 'completed' else 'error'
+    return json.dumps(payload)
+
+
+BODIES = [sign(payload) for payload in PAYLOADS]
+BODIES += [tampered(body) for body in BODIES] + [sign(PAYLOADS[0], 'other-key')]
+
+
+@pytest.mark.parametrize('body', BODIES)
+def test_verifier_agrees_with_baseline(body):
+    verifier = plisio.CallbackVerifier(API_KEY)
+    expected = baseline_validate(API_KEY, body)
+
+    assert verifier.verify(body) is expected
+    assert verifier.verify(body.encode('utf8')) is expected
+    assert verifier.verify(memoryview(body.encode('utf8'))) is expected
+    assert plisio.PlisioClient(API_KEY).validate_callback(body) is expected
+
+
+def test_verifier_returns_the_payload():
+    payload = plisio.CallbackVerifier(API_KEY).load(BODIES[3])
+
+    assert payload['big'] == 2 ** 70
+    assert payload['verify_hash'] == json.loads(BODIES[3])['verify_hash']
+
+
+@pytest.mark.parametrize('body', ['', 'not json', '[1, 2]', '{"txn_id": "1"}', '{"verify_hash": 1}'])
+def test_verifier_rejects_malformed_bodies(body):
+    assert plisio.CallbackVerifier(API_KEY).load(body) is None
+
+
+def test_verify_many():
+    verifier = plisio.CallbackVerifier(API_KEY)
+
+    assert verifier.verify_many(BODIES) == [baseline_validate(API_KEY, body) for body in BODIES]
+
+
+def test_deduplicator_in_memory():
+    deduplicator = plisio.CallbackDeduplicator(maxsize=2)
+    first, second, third = [json.loads(body) for body in BODIES[:3]]
+
+    assert [deduplicator.seen(p) for p in (first, first, second, third, first)] == [False, True, False, False, False]
+    assert (deduplicator.passed, deduplicator.hits) == (4, 1)
+
+
+def test_deduplicator_store_survives_restarts(tmp_path):
+    path = str(tmp_path / 'callbacks.db')
+    payload = json.loads(BODIES[0])
+
+    deduplicator = plisio.CallbackDeduplicator(path=path)
+    assert deduplicator.seen(payload) is False
+    deduplicator.close()
+
+    restarted = plisio.CallbackDeduplicator(path=path)
+    assert run(restarted.aseen(payload)) is True
+    assert restarted.store_hits == 1
+
+    run(restarted.adiscard(payload))
+    assert plisio.CallbackDeduplicator(path=path).seen(payload) is False
+    restarted.close()
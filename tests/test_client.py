@@ -0,0 +1,65 @@
+import pytest
+
+import plisio
+
+from .helpers import error, run
+
+
+@pytest.mark.parametrize('status, exception', [
+    (400, plisio.BadRequestError),
+    (401, plisio.UnauthorizedError),
+    (403, plisio.ForbiddenError),
+    (404, plisio.NotFoundError),
+    (405, plisio.MethodNotAllowedError),
+    (406, plisio.NotAcceptableError),
+    (415, plisio.UnsupportedMediaTypeError),
+    (422, plisio.UnprocessableEntityTypeError),
+    (429, plisio.RateLimitReachedError),
+    (500, plisio.InternalServerError),
+    (503, plisio.ServiceUnavailableError),
+    (418, plisio.PlisioError),
+])
+def test_error_mapping(status, exception):
+    client = plisio.PlisioClient('key', transport=plisio.FakeTransport(lambda method, url, params: (status, error('no'))))
+
+    with pytest.raises(exception) as raised:
+        client.get_balance(plisio.CryptoCurrency.BTC)
+    assert type(raised.value) is exception
+
+
+def test_transport_and_decode_errors_are_unknown_api_errors():
+    def refuse(method, url, params):
+        raise ConnectionError()
+
+    client = plisio.PlisioClient('key', transport=plisio.FakeTransport(refuse))
+    with pytest.raises(plisio.UnknownPlisioAPIError):
+        client.get_balance(plisio.CryptoCurrency.BTC)
+
+    html = plisio.TransportResponse(502, {}, b'<html>Bad gateway</html>')
+    client = plisio.PlisioClient('key', transport=plisio.FakeTransport(lambda method, url, params: html))
+    with pytest.raises(plisio.UnknownPlisioAPIError):
+        client.get_balance(plisio.CryptoCurrency.BTC)
+
+
+def test_invoice_redirect():
+    transport = plisio.FakeTransport(
+        lambda method, url, params: plisio.FakeTransport.redirect('https://plisio.net/invoice/abc')
+    )
+    client = plisio.PlisioClient('key', transport=transport)
+
+    invoice = client.invoice(plisio.CryptoCurrency.BTC, 'order', 1, amount=0.1, redirect_to_invoice=True)
+    assert invoice.invoice_url == 'https://plisio.net/invoice/abc'
+    method, url, params = transport.calls[0]
+    assert url.endswith('/invoices/new')
+    assert params['redirect_to_invoice'] == '1'
+    assert params['api_key'] == 'key'
+
+
+def test_aio_invoice_redirect():
+    async def handler(method, url, params):
+        return plisio.AioFakeTransport.redirect('https://plisio.net/invoice/abc')
+
+    client = plisio.PlisioAioClient('key', transport=plisio.AioFakeTransport(handler))
+
+    invoice = run(client.invoice(plisio.CryptoCurrency.BTC, 'order', 1, amount=0.1, redirect_to_invoice=True))
+    assert invoice.invoice_url == 'https://plisio.net/invoice/abc'
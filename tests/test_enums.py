@@ -0,0 +1,50 @@
+from enum import Enum
+
+import pytest
+
+import plisio
+
+
+ENUMS = [
+    value for value in vars(plisio.plisio_enums).values()
+    if isinstance(value, type) and issubclass(value, Enum) and value is not Enum
+]
+
+
+def baseline_getitem(enum, item):
+    """
+    _EnumMeta.__getitem__ of plisio 1.0.11
+    """
+    key = item.replace(' ', '_')
+    if key not in enum._member_map_:
+        key = '_' + key
+    return enum._member_map_[key]
+
+
+def spellings(name):
+    name_ = name[1:] if name.startswith('_') else name
+    return {name, name_, name_.replace('_', ' '), name_.replace('_', '-')}
+
+
+@pytest.mark.parametrize('enum', ENUMS, ids=lambda enum: enum.__name__)
+def test_decode_map_holds_the_accepted_spellings(enum):
+    expected = {spelling for name in enum._member_map_ for spelling in spellings(name)}
+
+    assert set(enum._decode_map_) == expected
+    for name, member in enum._member_map_.items():
+        for spelling in spellings(name):
+            assert enum[spelling] is member
+            if '-' not in spelling:
+                assert baseline_getitem(enum, spelling) is member
+
+
+def test_operation_status_spellings():
+    status = plisio.OperationStatus
+
+    assert status['111'] is status['_111'] is status._111
+    assert status['cancelled duplicate'] is status['cancelled-duplicate'] is status.cancelled_duplicate
+    assert plisio.CryptoCurrency['USDT TRX'] is plisio.CryptoCurrency['USDT-TRX'] is plisio.CryptoCurrency.USDT_TRX
+    assert status[None] is None
+    for item in ('-111', '-22', '__111', 'Completed'):
+        with pytest.raises(KeyError):
+            status[item]
@@ -0,0 +1,96 @@
+from functools import partial
+
+import threading
+
+import plisio
+
+from .helpers import success
+
+
+def client(**kwargs):
+    transport = plisio.FakeTransport(lambda method, url, params: success({'psys_cid': 'BTC', 'balance': '1'}))
+    return plisio.PlisioClient('key', transport=transport, **kwargs)
+
+
+def fail(message):
+    raise ValueError(message)
+
+
+def test_map_keeps_the_order_of_calls():
+    with client() as plisio_client:
+        futures = plisio_client.map([partial(str, 1), partial(fail, 'no'), partial(str, 3)])
+
+        assert [future.exception() is None and future.result() for future in futures] == ['1', False, '3']
+        assert str(futures[1].exception()) == 'no'
+        assert plisio_client.map([]) == []
+
+
+def test_map_runs_at_most_max_workers_calls():
+    lock = threading.Lock()
+    running = [0, 0]
+
+    def call():
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        threading.Event().wait(0.01)
+        with lock:
+            running[0] -= 1
+
+    with client(max_workers=8) as plisio_client:
+        futures = plisio_client.map([call] * 12, max_workers=3)
+        assert all(future.result(5) is None for future in futures)
+
+    assert running[1] == 3
+
+
+def test_map_of_prepared_requests():
+    with client() as plisio_client:
+        requests = [plisio_client._get_balance_request(currency=plisio.CryptoCurrency.BTC) for _ in range(3)]
+
+        assert [future.result(5).balance for future in plisio_client.map(requests)] == [1.0] * 3
+
+
+def test_submit_runs_on_the_pool():
+    with client() as plisio_client:
+        thread = plisio_client.submit(threading.current_thread).result(5)
+        assert thread is not threading.current_thread()
+        assert plisio_client.submit(plisio_client.get_balance, plisio.CryptoCurrency.BTC).result(5).balance == 1.0
+
+
+def test_submit_from_the_pool_runs_in_the_calling_thread():
+    with client(max_workers=1) as plisio_client:
+        def nested():
+            return threading.current_thread(), plisio_client.submit(threading.current_thread).result(5)
+
+        outer, inner = plisio_client.submit(nested).result(5)
+        assert outer is inner
+
+
+def test_map_from_the_pool_does_not_wait_for_a_free_worker():
+    with client(max_workers=1) as plisio_client:
+        def nested():
+            return [future.result(5) for future in plisio_client.map([partial(str, i) for i in range(4)])]
+
+        assert plisio_client.submit(nested).result(5) == ['0', '1', '2', '3']
+
+
+def test_pooled_methods_from_the_pool():
+    invoice = success({'txn_id': 'txn', 'invoice_url': 'https://plisio.net/invoice/txn'})
+    pages = [
+        success({'operations': [], '_links': {'next': {'href': '/operations?page=2'}}}),
+        success({'operations': [], '_links': {}}),
+    ]
+
+    def handler(method, url, params):
+        if url.endswith('/invoices/new'):
+            return invoice
+        return pages[int(params.get('page') or 1) - 1]
+
+    with plisio.PlisioClient('key', transport=plisio.FakeTransport(handler), max_workers=1) as plisio_client:
+        spec = {'currency': plisio.CryptoCurrency.BTC, 'order_name': 'order', 'order_number': 1, 'amount': 0.1}
+        created = plisio_client.submit(plisio_client.create_invoices, [spec] * 3).result(5)
+        assert [result.txn_id for result in created] == ['txn'] * 3
+
+        operations = plisio_client.submit(lambda: list(plisio_client.iter_operations(prefetch=True))).result(5)
+        assert operations == []
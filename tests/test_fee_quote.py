@@ -0,0 +1,103 @@
+import threading
+
+import plisio
+
+from .helpers import error, success
+
+
+BTC = plisio.CryptoCurrency.BTC
+ETH = plisio.CryptoCurrency.ETH
+
+
+class FakeCommissions:
+    """
+    Handler of commission requests; the fee grows with every request and failing currencies get 503
+    """
+
+    def __init__(self, *failing: str):
+        self.failing = set(failing)
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, method, url, params):
+        currency = url.rsplit('/', 1)[1]
+        if currency in self.failing:
+            return 503, error('busy')
+        with self.lock:
+            self.requests += 1
+            fee = self.requests / 10000
+        return success({'commission': '0', 'fee': str(fee), 'maxAmount': '100', 'plan': 'normal'})
+
+
+def quotes(fake, **kwargs):
+    client = plisio.PlisioClient('key', transport=plisio.FakeTransport(fake))
+    return plisio.FeeQuoteCache(client, **kwargs)
+
+
+def test_quotes_are_shared_within_a_bucket():
+    fake = FakeCommissions()
+    cache = quotes(fake)
+
+    first = cache.get_commission(BTC, ['a'], [0.3])
+    assert cache.get_commission(BTC, ['b'], [0.35]) is first
+    assert cache.get_commission(BTC, ['a', 'b'], [0.1, 0.2]) is not first
+    assert cache.get_commission(BTC, ['a'], [1.0]) is not first
+    assert cache.get_commission(ETH, ['a'], [0.3]) is not first
+
+    assert (cache.hits, cache.misses, len(cache), fake.requests) == (1, 4, 4, 4)
+
+
+def test_old_quotes_are_requested_again():
+    fake = FakeCommissions()
+    cache = quotes(fake, ttl=60)
+
+    first = cache.get_commission(BTC, 'a', 0.3)
+    assert cache.get_commission(BTC, 'a', 0.3, max_age=0).fee != first.fee
+    assert fake.requests == 2
+
+
+def test_refresh_of_used_quotes_of_the_currencies():
+    fake = FakeCommissions()
+    cache = quotes(fake, currencies=[BTC], refresh_interval=0)
+    btc = cache.get_commission(BTC, 'a', 0.3)
+    cache.get_commission(ETH, 'a', 0.3)
+
+    assert cache.refresh() == 1
+    assert cache.get_commission(BTC, 'a', 0.3).fee != btc.fee
+    assert (cache.refreshes, fake.requests) == (1, 3)
+
+
+def test_unused_quotes_are_dropped():
+    cache = quotes(FakeCommissions(), keep_warm=0, refresh_interval=0)
+    cache.get_commission(BTC, 'a', 0.3)
+
+    assert cache.refresh() == 0
+    assert len(cache) == 0
+
+
+def test_failed_refresh_keeps_the_quote():
+    fake = FakeCommissions()
+    cache = quotes(fake, refresh_interval=0)
+    quote = cache.get_commission(BTC, 'a', 0.3)
+    fake.failing.add('BTC')
+
+    assert cache.refresh() == 0
+    assert cache.get_commission(BTC, 'a', 0.3) is quote
+
+
+def test_refresher_thread():
+    fake = FakeCommissions()
+    cache = quotes(fake, refresh_interval=0.005)
+    cache.get_commission(BTC, 'a', 0.3)
+
+    with cache:
+        for _ in range(1000):
+            if cache.refreshes >= 3:
+                break
+            threading.Event().wait(0.005)
+
+    assert cache.refreshes >= 3
+
+    refreshes = cache.refreshes
+    threading.Event().wait(0.02)
+    assert cache.refreshes == refreshes
@@ -0,0 +1,79 @@
+import math
+
+import pytest
+
+import plisio
+
+from .helpers import operation, page_ids, run
+from .test_operations import pages_handler
+
+
+BTC = plisio.CryptoCurrency.BTC
+ETH = plisio.CryptoCurrency.ETH
+COMPLETED = plisio.OperationStatus.completed
+PENDING = plisio.OperationStatus.pending
+
+
+def frame():
+    return plisio.OperationsFrame.from_pages([
+        {'operations': [
+            operation('a', 'completed', currency='BTC', amount='0.5', user_id='7'),
+            operation('b', 'pending', currency='ETH', amount='2'),
+        ]},
+        {'operations': [
+            operation('c', 'completed', currency='ETH', amount='1.5'),
+            operation('d', 'completed', currency='NOPE', amount=''),
+            operation('e', 'completed', currency='BTC', amount='0.25', fee=None),
+        ]},
+    ])
+
+
+def test_columns():
+    operations = frame()
+
+    assert len(operations) == 5
+    assert operations.column('id') == ['a', 'b', 'c', 'd', 'e']
+    assert list(operations.column('amount'))[:3] == [0.5, 2.0, 1.5]
+    assert math.isnan(operations.column('amount')[3])
+    assert list(operations.column('user_id')) == [7, 0, 0, 0, 0]
+    assert operations.decoded('currency') == [BTC, ETH, ETH, None, BTC]
+    assert memoryview(operations.column('amount')).format == 'd'
+
+
+def test_filter():
+    operations = frame()
+
+    completed = operations.filter(status=COMPLETED)
+    assert completed.column('id') == ['a', 'c', 'd', 'e']
+    assert operations.filter(status=COMPLETED, currency=[BTC]).column('id') == ['a', 'e']
+    assert operations.filter([True, False, False, False, True], currency=ETH).column('id') == []
+    assert operations.filter() is operations
+
+
+def test_group_sum():
+    operations = frame()
+
+    assert operations.group_sum('currency') == {BTC: 0.75, ETH: 3.5}
+    assert operations.group_sum(['status', 'currency']) == {
+        (COMPLETED, BTC): 0.75,
+        (PENDING, ETH): 2.0,
+        (COMPLETED, ETH): 1.5,
+    }
+
+
+def test_group_sum_agrees_with_the_models():
+    client = plisio.PlisioClient('key', transport=plisio.FakeTransport(pages_handler(3)))
+    totals = {}
+    for model in client.iter_operations():
+        totals[model.currency] = totals.get(model.currency, 0.0) + model.amount
+
+    operations = client.get_operations_frame()
+
+    assert operations.column('id') == page_ids(1, 3)
+    assert operations.group_sum('currency') == pytest.approx(totals)
+
+
+def test_aio_operations_frame():
+    client = plisio.PlisioAioClient('key', transport=plisio.AioFakeTransport(pages_handler(3)))
+
+    assert run(client.get_operations_frame(page=2)).column('id') == page_ids(2, 3)
@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, '-c', code],
+        stdout=subprocess.PIPE,
+        cwd=ROOT,
+        check=True,
+    ).stdout.decode().strip()
+
+
+def test_import_does_not_load_http_clients():
+    output = run_python(
+        'import sys, plisio; '
+        'print(",".join(name for name in ("requests", "aiohttp", "httpx") if name in sys.modules))'
+    )
+    assert output == ''
+
+
+def test_clients_load_http_clients_on_first_use():
+    output = run_python(
+        'import sys, plisio; '
+        'plisio.PlisioClient("key").transport.session; '
+        'print("requests" in sys.modules, "aiohttp" in sys.modules)'
+    )
+    assert output.split() == ['True', 'False']
@@ -0,0 +1,71 @@
+import asyncio
+import threading
+
+import plisio
+
+from .helpers import error, run, success
+
+
+def specs(count):
+    return [
+        {'currency': plisio.CryptoCurrency.BTC, 'order_name': f'order {i}', 'order_number': i, 'amount': 0.1}
+        for i in range(count)
+    ]
+
+
+def invoice_handler(method, url, params):
+    order_number = str(params['order_number'])
+    if order_number == '2':
+        return 422, error('Bad amount')
+    return success({'txn_id': f'txn-{order_number}', 'invoice_url': f'https://plisio.net/invoice/{order_number}'})
+
+
+def test_create_invoices_keeps_the_order_of_specs():
+    transport = plisio.FakeTransport(invoice_handler)
+    client = plisio.PlisioClient('key', transport=transport)
+
+    results = client.create_invoices(specs(5), concurrency=3)
+
+    assert [getattr(result, 'txn_id', None) for result in results] == ['txn-0', 'txn-1', None, 'txn-3', 'txn-4']
+    assert isinstance(results[2], plisio.UnprocessableEntityTypeError)
+    assert sorted(str(params['order_number']) for method, url, params in transport.calls) == ['0', '1', '2', '3', '4']
+    client.close()
+
+
+def test_create_invoices_runs_up_to_concurrency_calls():
+    lock = threading.Lock()
+    running = [0, 0]
+
+    def handler(method, url, params):
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        threading.Event().wait(0.01)
+        with lock:
+            running[0] -= 1
+        return invoice_handler(method, url, params)
+
+    client = plisio.PlisioClient('key', transport=plisio.FakeTransport(handler))
+
+    assert len(client.create_invoices(specs(8), concurrency=2)) == 8
+    assert running[1] == 2
+    client.close()
+
+
+def test_aio_create_invoices():
+    running = [0, 0]
+
+    async def handler(method, url, params):
+        running[0] += 1
+        running[1] = max(running)
+        await asyncio.sleep(0.01)
+        running[0] -= 1
+        return invoice_handler(method, url, params)
+
+    client = plisio.PlisioAioClient('key', transport=plisio.AioFakeTransport(handler))
+
+    results = run(client.create_invoices(specs(6), concurrency=3))
+
+    assert [getattr(result, 'txn_id', None) for result in results] == ['txn-0', 'txn-1', None, 'txn-3', 'txn-4', 'txn-5']
+    assert isinstance(results[2], plisio.UnprocessableEntityTypeError)
+    assert running[1] == 3
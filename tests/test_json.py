@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+import plisio
+
+from .helpers import run, success
+from .test_callback import API_KEY, BODIES, baseline_validate
+
+
+BALANCE = success({'psys_cid': 'BTC', 'currency': 'BTC', 'balance': '1.5', 'locked_balance': '0'})
+
+
+class CountingLoads:
+    def __init__(self):
+        self.bodies = []
+
+    def __call__(self, body):
+        self.bodies.append(body)
+        return json.loads(body)
+
+
+@pytest.mark.parametrize('body', [
+    b'{"status": "success", "data": {"amount": "0.1", "big": 1180591620717411303424, "rate": 1e-05}}',
+    '{"status": "error", "data": {"message": "\\u0417\\u0430\\u043a\\u0430\\u0437 \\u2713"}}'.encode('utf8'),
+    b'[]',
+])
+def test_default_decoder_agrees_with_json(body):
+    assert plisio.plisio_json.json_loads(body) == json.loads(body)
+
+
+def test_client_decodes_with_the_given_decoder():
+    loads = CountingLoads()
+    client = plisio.PlisioClient(
+        'key',
+        transport=plisio.FakeTransport(lambda method, url, params: BALANCE),
+        json_loads=loads,
+    )
+
+    assert client.get_balance(plisio.CryptoCurrency.BTC).balance == 1.5
+    assert loads.bodies == [json.dumps(BALANCE).encode('utf8')]
+
+
+def test_aio_client_decodes_with_the_given_decoder():
+    loads = CountingLoads()
+    client = plisio.PlisioAioClient(
+        'key',
+        transport=plisio.AioFakeTransport(lambda method, url, params: BALANCE),
+        json_loads=loads,
+    )
+
+    assert run(client.get_balance(plisio.CryptoCurrency.BTC)).balance == 1.5
+    assert len(loads.bodies) == 1
+
+
+def test_client_decoder_is_not_used_for_callbacks():
+    loads = CountingLoads()
+    client = plisio.PlisioClient(API_KEY, json_loads=loads)
+
+    assert [client.validate_callback(body) for body in BODIES] == [baseline_validate(API_KEY, body) for body in BODIES]
+    assert loads.bodies == []
+
+
+def test_callback_verifier_with_a_custom_decoder():
+    loads = CountingLoads()
+    verifier = plisio.CallbackVerifier(API_KEY, json_loads=loads)
+
+    assert verifier.verify(BODIES[0]) is True
+    assert len(loads.bodies) == 1
@@ -0,0 +1,75 @@
+import pytest
+
+import plisio
+
+from .helpers import operation, run, success
+from .test_operations import pages_handler
+
+
+RICH = operation(
+    'op-1',
+    'mismatch',
+    user_id=7,
+    shop_id='shop',
+    type='cash_out',
+    source_currency='USD',
+    source_rate='27000.5',
+    fee='0.0001',
+    pending_sum='0',
+    sum='0.1001',
+    commission='0.0002',
+    created_at_utc=1690000000,
+    expire_at_utc=1690003600,
+    tx_url=['https://blockchair.com/bitcoin/transaction/abc'],
+    tx_id=['abc'],
+    params={'order_number': '5', 'order_name': 'order', 'source_amount': '10', 'amount': '0.1'},
+    status_code=3,
+)
+
+
+def plain(value):
+    return value._as_dict() if isinstance(value, plisio.PlisioModel) else value
+
+
+def test_lazy_operation_decodes_like_operation():
+    eager = plisio.Operation.from_response(RICH)
+    lazy = plisio.LazyOperation.from_response(dict(RICH))
+
+    for name in plisio.Operation.__slots__:
+        assert plain(getattr(lazy, name)) == plain(getattr(eager, name)), name
+    assert lazy.status is plisio.OperationStatus.mismatch
+    assert isinstance(lazy, plisio.Operation)
+
+
+def test_lazy_operation_decodes_each_field_once():
+    response = dict(RICH)
+    lazy = plisio.LazyOperation.from_response(response)
+
+    assert lazy.amount == 0.1
+    response['amount'] = '5'
+    response['currency'] = 'ETH'
+
+    assert lazy.amount == 0.1
+    assert lazy.currency is plisio.CryptoCurrency.ETH
+    with pytest.raises(AttributeError):
+        lazy.missing
+
+
+def test_client_with_lazy_models():
+    client = plisio.PlisioClient(
+        'key',
+        transport=plisio.FakeTransport(lambda method, url, params: success(RICH)),
+        lazy_models=True,
+    )
+
+    assert type(client.get_operation('op-1')) is plisio.LazyOperation
+    assert type(plisio.PlisioClient('key', transport=client.transport).get_operation('op-1')) is plisio.Operation
+
+    aio_client = plisio.PlisioAioClient('key', transport=plisio.AioFakeTransport(pages_handler(2)), lazy_models=True)
+
+    async def collect():
+        return [o async for o in aio_client.aiter_operations()]
+
+    operations = run(collect())
+    assert {type(o) for o in operations} == {plisio.LazyOperation}
+    assert [o.id for o in operations] == ['1-0', '1-1', '2-0', '2-1']
@@ -0,0 +1,78 @@
+import pytest
+
+import plisio
+
+from .helpers import operations_page, page_ids, run, success
+
+
+def pages_handler(page_count, meta=True, failing=()):
+    failing = set(failing)
+
+    def handler(method, url, params):
+        page = int(params.get('page') or 1)
+        if page in failing:
+            failing.discard(page)
+            return 500, {'status': 'error', 'data': {}, 'message': 'failed'}
+        return success(operations_page(page, page_count, meta=meta))
+
+    return handler
+
+
+@pytest.mark.parametrize('prefetch', [False, True])
+def test_iter_operations_follows_pages(prefetch):
+    transport = plisio.FakeTransport(pages_handler(3))
+    client = plisio.PlisioClient('key', transport=transport)
+
+    assert [o.id for o in client.iter_operations(prefetch=prefetch)] == page_ids(1, 3)
+    assert [params['page'] for method, url, params in transport.calls] == [1, 2, 3]
+
+
+def test_aio_iter_operations_follows_pages():
+    client = plisio.PlisioAioClient('key', transport=plisio.AioFakeTransport(pages_handler(3)))
+
+    async def collect():
+        return [o.id async for o in client.aiter_operations(page=2, prefetch=True)]
+
+    assert run(collect()) == page_ids(2, 3)
+
+
+def export(client, start_page=1, end_page=None, **kwargs):
+    async def collect():
+        return [o.id async for o in client.export_operations(start_page, end_page, **kwargs)]
+
+    return run(collect())
+
+
+@pytest.mark.parametrize('meta', [True, False])
+def test_export_operations(meta):
+    client = plisio.PlisioAioClient('key', transport=plisio.AioFakeTransport(pages_handler(5, meta=meta)))
+
+    assert export(client, concurrency=3) == page_ids(1, 5)
+    assert export(client, 2, 4) == page_ids(2, 4)
+    assert export(client, 4, 2) == []
+
+
+def test_export_operations_resumes_from_the_failed_page():
+    transport = plisio.AioFakeTransport(pages_handler(6, failing={4}))
+    client = plisio.PlisioAioClient('key', transport=transport)
+    exported = []
+
+    async def collect(start_page):
+        async for operation in client.export_operations(start_page, concurrency=2):
+            exported.append(operation.id)
+
+    with pytest.raises(plisio.OperationsExportError) as raised:
+        run(collect(1))
+    assert raised.value.next_page == 4
+    assert exported == page_ids(1, 3)
+
+    run(collect(raised.value.next_page))
+    assert exported == page_ids(1, 6)
+
+
+def test_export_operations_fails_on_the_first_page():
+    client = plisio.PlisioAioClient('key', transport=plisio.AioFakeTransport(pages_handler(3, failing={2})))
+
+    with pytest.raises(plisio.OperationsExportError) as raised:
+        export(client, 2)
+    assert raised.value.next_page == 2
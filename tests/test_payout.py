@@ -0,0 +1,152 @@
+import pytest
+
+import plisio
+
+from .helpers import error, success
+
+
+BTC = plisio.CryptoCurrency.BTC
+ETH = plisio.CryptoCurrency.ETH
+
+
+class FakePlisio:
+    """
+    Handler of commission and withdraw requests; withdraw answers with the queued statuses, then succeeds
+    """
+
+    def __init__(self, *withdraw_statuses: int):
+        self.withdraw_statuses = list(withdraw_statuses)
+        self.withdrawals = []
+
+    def __call__(self, method, url, params):
+        if '/operations/commission/' in url:
+            return success({'commission': '0', 'fee': '0.0001', 'maxAmount': '100', 'plan': 'normal'})
+        if url.endswith('/operations/withdraw'):
+            self.withdrawals.append(params['to'].split(','))
+            if self.withdraw_statuses:
+                status = self.withdraw_statuses.pop(0)
+                if status:
+                    return status, error(f'Failed with {status}')
+            return success({'id': f'w{len(self.withdrawals)}', 'type': 'cash_out', 'status': 'completed',
+                            'psys_cid': params['psys_cid'], 'amount': '1'})
+        raise AssertionError(url)
+
+
+def payouts():
+    return [
+        plisio.Payout('alice', BTC, 'address-a', 0.1),
+        plisio.Payout('bob', BTC, 'address-b', 0.2),
+        plisio.Payout('carol', ETH, 'address-c', 1.5),
+    ]
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return str(tmp_path / 'payouts.db')
+
+
+def engine(ledger, fake, **kwargs):
+    client = plisio.PlisioClient('key', transport=plisio.FakeTransport(fake))
+    return plisio.PayoutEngine(client, ledger, **kwargs)
+
+
+def statuses(outcomes):
+    return [(o.payout.recipient_id, o.status.name) for o in outcomes]
+
+
+def test_payouts_are_batched_by_currency(ledger):
+    fake = FakePlisio()
+
+    outcomes = engine(ledger, fake, batch_size=10).run(payouts())
+
+    assert statuses(outcomes) == [('alice', 'paid'), ('bob', 'paid'), ('carol', 'paid')]
+    assert sorted(fake.withdrawals) == [['address-a', 'address-b'], ['address-c']]
+    assert outcomes[0].withdraw_id == outcomes[1].withdraw_id != outcomes[2].withdraw_id
+
+
+def test_repeated_run_skips_paid_payouts(ledger):
+    engine(ledger, FakePlisio()).run(payouts())
+    fake = FakePlisio()
+
+    outcomes = engine(ledger, fake).run(payouts())
+
+    assert statuses(outcomes) == [('alice', 'paid'), ('bob', 'paid'), ('carol', 'paid')]
+    assert fake.withdrawals == []
+
+
+def test_rejected_batch_fails_and_is_retried(ledger):
+    fake = FakePlisio(422)
+    first = engine(ledger, fake, batch_size=1, concurrency=1).run(payouts()[:2])
+    assert statuses(first) == [('alice', 'failed'), ('bob', 'paid')]
+    assert first[0].error
+
+    fake = FakePlisio()
+    second = engine(ledger, fake).run(payouts()[:2])
+    assert statuses(second) == [('alice', 'paid'), ('bob', 'paid')]
+    assert fake.withdrawals == [['address-a']]
+
+
+def test_ambiguous_batch_stays_pending_until_resolved(ledger):
+    payout_engine = engine(ledger, FakePlisio(503))
+    assert statuses(payout_engine.run(payouts()[:1])) == [('alice', 'pending')]
+
+    fake = FakePlisio()
+    assert statuses(engine(ledger, fake).run(payouts()[:1])) == [('alice', 'pending')]
+    assert fake.withdrawals == []
+
+    payout_engine.resolve('alice', paid=False)
+    payout_engine.close()
+    assert statuses(engine(ledger, fake).run(payouts()[:1])) == [('alice', 'paid')]
+    assert fake.withdrawals == [['address-a']]
+
+
+def test_invalid_payouts_are_not_sent(ledger):
+    fake = FakePlisio()
+    batch = payouts() + [
+        plisio.Payout('alice', BTC, 'address-x', 0.3),
+        plisio.Payout('dave', BTC, 'address d', 0.1),
+        plisio.Payout('erin', BTC, 'address-e', -1),
+        plisio.Payout('frank', 'BTC', 'address-f', 1),
+    ]
+
+    outcomes = engine(ledger, fake).run(batch)
+
+    assert statuses(outcomes) == [
+        ('alice', 'paid'),
+        ('bob', 'paid'),
+        ('carol', 'paid'),
+        ('alice', 'invalid'),
+        ('dave', 'invalid'),
+        ('erin', 'invalid'),
+        ('frank', 'invalid'),
+    ]
+    assert outcomes[3].error == 'Duplicate recipient_id'
+    assert outcomes[3].payout.address == 'address-x'
+
+
+def test_changed_payout_is_invalid(ledger):
+    engine(ledger, FakePlisio()).run(payouts()[:1])
+
+    outcomes = engine(ledger, FakePlisio()).run([plisio.Payout('alice', BTC, 'address-a', 0.5)])
+
+    assert statuses(outcomes) == [('alice', 'invalid')]
+    assert outcomes[0].error == 'Payout differs from the ledger'
+
+
+def test_batch_above_max_fee_fails_without_sending(ledger):
+    fake = FakePlisio()
+
+    outcomes = engine(ledger, fake, max_fee=0.00001).run(payouts()[:1])
+
+    assert statuses(outcomes) == [('alice', 'failed')]
+    assert fake.withdrawals == []
+
+
+def test_batch_above_the_available_amount_fails_without_sending(ledger):
+    fake = FakePlisio()
+
+    outcomes = engine(ledger, fake).run([plisio.Payout('alice', BTC, 'address-a', 150)])
+
+    assert statuses(outcomes) == [('alice', 'failed')]
+    assert outcomes[0].error.startswith('Total 150')
+    assert fake.withdrawals == []
@@ -0,0 +1,139 @@
+import asyncio
+
+import plisio
+
+from .helpers import error, operation, run, success
+
+
+NEW = plisio.OperationStatus.new
+PENDING = plisio.OperationStatus.pending
+COMPLETED = plisio.OperationStatus.completed
+
+
+def scripted(statuses):
+    """
+    Handler answering each invoice with its next status; an int is an error status, the last one repeats
+    """
+    statuses = {invoice_id: list(sequence) for invoice_id, sequence in statuses.items()}
+
+    def handler(method, url, params):
+        invoice_id = url.rsplit('/', 1)[1]
+        sequence = statuses[invoice_id]
+        status = sequence.pop(0) if len(sequence) > 1 else sequence[0]
+        if isinstance(status, int):
+            return status, error('Failed')
+        return success(operation(invoice_id, status))
+
+    return handler
+
+
+def poller(client, **kwargs):
+    options = {'rate': 1000, 'intervals': {}, 'default_interval': 0.001, 'backoff': 1, 'expiry_grace': 0}
+    return plisio.InvoicePoller(client, **{**options, **kwargs})
+
+
+def events_of(handler, *invoice_ids, **kwargs):
+    transport = plisio.AioFakeTransport(handler)
+    client = plisio.PlisioAioClient('key', transport=transport)
+
+    async def main():
+        invoice_poller = poller(client, **kwargs)
+        for invoice_id in invoice_ids:
+            invoice_poller.track(invoice_id)
+        events = [(e.invoice_id, e.previous_status, e.status) async for e in invoice_poller]
+        return invoice_poller, events
+
+    invoice_poller, events = run(main())
+    return invoice_poller, events, transport
+
+
+def test_status_changes_until_a_terminal_status():
+    handler = scripted({'a': ['new', 'new', 'pending', 'pending', 'completed']})
+
+    invoice_poller, events, transport = events_of(handler, 'a')
+
+    assert events == [('a', None, NEW), ('a', NEW, PENDING), ('a', PENDING, COMPLETED)]
+    assert invoice_poller.checks == len(transport.calls) == 5
+    assert len(invoice_poller) == 0
+
+
+def test_failed_checks_are_retried():
+    handler = scripted({'a': [503, 'weird', 'pending', 'expired']})
+
+    invoice_poller, events, transport = events_of(handler, 'a')
+
+    assert events == [('a', None, PENDING), ('a', PENDING, plisio.OperationStatus.expired)]
+    assert invoice_poller.failed == 2
+    assert invoice_poller.checks == 4
+
+
+def test_invoices_are_polled_independently():
+    handler = scripted({'a': ['completed'], 'b': ['new', 'mismatch'], 'c': ['pending', 'pending', 'cancelled']})
+
+    invoice_poller, events, transport = events_of(handler, 'a', 'b', 'c', concurrency=2)
+
+    assert [event for event in events if event[0] == 'b'] == [
+        ('b', None, NEW),
+        ('b', NEW, plisio.OperationStatus.mismatch),
+    ]
+    assert sorted(event[2].name for event in events) == ['cancelled', 'completed', 'mismatch', 'new', 'pending']
+
+
+def test_known_status_has_no_event_until_it_changes():
+    transport = plisio.AioFakeTransport(scripted({'a': ['new', 'completed']}))
+    client = plisio.PlisioAioClient('key', transport=transport)
+
+    async def main():
+        invoice_poller = poller(client)
+        invoice_poller.track('a', NEW)
+        invoice_poller.track('done', COMPLETED)
+        assert 'done' not in invoice_poller
+        return [(e.previous_status, e.status) async for e in invoice_poller]
+
+    assert run(main()) == [(NEW, COMPLETED)]
+
+
+def test_delays_grow_while_the_status_does_not_change():
+    transport = plisio.AioFakeTransport(scripted({'a': ['new']}))
+    client = plisio.PlisioAioClient('key', transport=transport)
+
+    async def main():
+        invoice_poller = poller(client, default_interval=0.005, backoff=2, max_interval=0.02)
+        invoice_poller.track('a')
+        checks = []
+
+        async def consume():
+            async for _ in invoice_poller:
+                pass
+
+        task = asyncio.ensure_future(consume())
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+            checks.append(invoice_poller.checks)
+        invoice_poller.untrack('a')
+        invoice_poller.close()
+        await task
+        return checks
+
+    checks = run(main())
+    assert checks[-1] - checks[-5] <= 3
+    assert checks[-1] < 15
+
+
+def test_keep_alive_waits_for_new_invoices_until_closed():
+    transport = plisio.AioFakeTransport(scripted({'a': ['completed'], 'b': ['expired']}))
+    client = plisio.PlisioAioClient('key', transport=transport)
+
+    async def main():
+        invoice_poller = poller(client, keep_alive=True)
+        invoice_poller.track('a')
+        events = []
+        async for event in invoice_poller:
+            events.append(event.invoice_id)
+            if event.invoice_id == 'a':
+                invoice_poller.track('b')
+            else:
+                invoice_poller.close()
+        return events
+
+    assert run(main()) == ['a', 'b']
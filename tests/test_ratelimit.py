@@ -0,0 +1,98 @@
+import threading
+import time
+
+import pytest
+
+import plisio
+
+from .helpers import run, success
+
+
+BALANCE = success({'psys_cid': 'BTC', 'balance': '1'})
+
+
+class RecordingBackend(plisio.LocalRateLimitBackend):
+    """
+    Local buckets that record the threads calling reserve
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.threads = []
+
+    def reserve(self, key, rate, capacity, tokens=1):
+        self.threads.append(threading.current_thread())
+        return super().reserve(key, rate, capacity, tokens)
+
+
+class SharedBackend(plisio.RateLimitBackend):
+    def __init__(self):
+        self.local = RecordingBackend()
+        self.threads = self.local.threads
+
+    def reserve(self, key, rate, capacity, tokens=1):
+        return self.local.reserve(key, rate, capacity, tokens)
+
+
+def test_local_backend_allows_a_burst_then_waits():
+    backend = plisio.LocalRateLimitBackend()
+
+    waits = [backend.reserve('key', rate=10, capacity=3) for _ in range(5)]
+
+    assert waits[:3] == [0, 0, 0]
+    assert waits[3] == pytest.approx(0.1, abs=0.01)
+    assert waits[4] == pytest.approx(0.2, abs=0.01)
+    assert backend.reserve('other', rate=10, capacity=3) == 0
+
+
+def test_sqlite_backend_shares_the_budget(tmp_path):
+    path = str(tmp_path / 'rate.db')
+    first = plisio.SQLiteRateLimitBackend(path)
+    second = plisio.SQLiteRateLimitBackend(path)
+
+    assert first.reserve('key', rate=1, capacity=2) == 0
+    assert second.reserve('key', rate=1, capacity=2) == 0
+    assert first.reserve('key', rate=1, capacity=2) == pytest.approx(1, abs=0.05)
+    first.close()
+    second.close()
+
+
+def test_token_bucket_limits_the_client():
+    transport = plisio.FakeTransport(lambda method, url, params: BALANCE)
+    bucket = plisio.TokenBucket(rate=100, capacity=1)
+    client = plisio.PlisioClient('key', transport=transport, rate_limit={'balances': bucket})
+
+    started = time.monotonic()
+    for _ in range(5):
+        client.get_balance(plisio.CryptoCurrency.BTC)
+
+    assert time.monotonic() - started >= 0.035
+    assert len(transport.calls) == 5
+
+
+def test_aio_token_bucket_keeps_local_buckets_on_the_loop():
+    backend = RecordingBackend()
+    bucket = plisio.AioTokenBucket(rate=100, capacity=1, backend=backend)
+
+    async def main():
+        started = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        return time.monotonic() - started
+
+    assert run(main()) >= 0.015
+    assert backend.threads == [threading.current_thread()] * 3
+
+
+def test_aio_token_bucket_reserves_off_the_loop():
+    backend = SharedBackend()
+    bucket = plisio.AioTokenBucket(rate=1000, backend=backend)
+    client = plisio.PlisioAioClient(
+        'key',
+        transport=plisio.AioFakeTransport(lambda method, url, params: BALANCE),
+        rate_limit=bucket,
+    )
+
+    assert run(client.get_balance(plisio.CryptoCurrency.BTC)).balance == 1.0
+    assert len(backend.threads) == 1
+    assert backend.threads[0] is not threading.current_thread()
@@ -0,0 +1,107 @@
+import asyncio
+import threading
+
+import pytest
+
+import plisio
+
+from .helpers import run, success
+
+
+BTC = plisio.CryptoCurrency.BTC
+ETH = plisio.CryptoCurrency.ETH
+TRX = plisio.CryptoCurrency.TRX
+USD = plisio.FiatCurrency.USD
+EUR = plisio.FiatCurrency.EUR
+
+
+def currency(cid, fiat, rate_usd, fiat_rate=None, precision='8'):
+    return {'cid': cid, 'currency': cid, 'fiat': fiat, 'rate_usd': rate_usd, 'fiat_rate': fiat_rate,
+            'precision': precision, 'min_sum_in': '0.0001'}
+
+
+RATES = {
+    'USD': [
+        currency('BTC', 'USD', '0.00002', '0.00002'),
+        currency('ETH', 'USD', '0.0005', '0.0005'),
+        currency('TRX', 'USD', '8', '8', precision='0'),
+    ],
+    'EUR': [
+        currency('BTC', 'EUR', '0.00002', '0.000022'),
+        currency('ETH', 'EUR', '0.0005'),
+    ],
+}
+
+
+def rates_handler(method, url, params):
+    return success(RATES[url.rsplit('/', 1)[1]])
+
+
+def table():
+    client = plisio.PlisioClient('key', transport=plisio.FakeTransport(rates_handler))
+    return plisio.RateTable.from_client(client, [USD, EUR])
+
+
+def test_conversions():
+    rates = table()
+
+    assert (len(rates), rates.fiat, BTC in rates) == (3, USD, True)
+    assert rates[BTC].fiat is USD
+    assert rates.to_crypto(100, BTC) == pytest.approx(0.002)
+    assert rates.to_crypto(100, BTC, EUR) == pytest.approx(0.0022)
+    assert rates.to_fiat(0.0022, BTC, EUR) == pytest.approx(100)
+    assert rates.convert_fiat(100, EUR) == pytest.approx(110)
+    assert list(rates.to_crypto_many([1, 2], ETH)) == pytest.approx([0.0005, 0.001])
+
+
+def test_fiat_without_its_own_rate_is_converted_through_usd():
+    rates = table()
+
+    assert rates.fiat_rate(ETH, EUR) == pytest.approx(0.0005 * 1.1)
+    with pytest.raises(KeyError):
+        rates.fiat_rate(plisio.CryptoCurrency.XMR)
+
+
+def test_rounding_to_the_precision():
+    rates = table()
+
+    assert rates.to_crypto(1.23456789, BTC, rounded=True) == round(1.23456789 * 0.00002, 8)
+    assert rates.to_crypto(1.3, TRX) == pytest.approx(10.4)
+    assert rates.to_crypto(1.3, TRX, rounded=True) == 10
+
+
+def test_refresher_replaces_the_table():
+    client = plisio.PlisioClient('key', transport=plisio.FakeTransport(rates_handler))
+
+    with plisio.RateTableRefresher(client, [USD], interval=0.001) as refresher:
+        first = refresher.table
+        assert first.to_crypto(1, ETH) == pytest.approx(0.0005)
+        for _ in range(1000):
+            if refresher.table is not first:
+                break
+            threading.Event().wait(0.001)
+
+    assert refresher.table is not first
+
+
+def test_aio_refresh_survives_any_error():
+    responses = [
+        success([currency('NEWCOIN', 'USD', '1', '1')]),
+        success(RATES['USD']),
+    ]
+    transport = plisio.AioFakeTransport(lambda method, url, params: responses.pop(0) if len(responses) > 1 else responses[0])
+    client = plisio.PlisioAioClient('key', transport=transport)
+    refresher = plisio.RateTableRefresher(client, [USD], interval=0.001)
+
+    async def main():
+        task = asyncio.ensure_future(refresher.arefresh_forever())
+        for _ in range(1000):
+            if refresher.table is not None:
+                break
+            await asyncio.sleep(0.001)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    run(main())
+    assert refresher.table.to_crypto(1, BTC) == pytest.approx(0.00002)
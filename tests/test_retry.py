@@ -0,0 +1,73 @@
+import pytest
+
+import plisio
+
+from .helpers import error, run, success
+
+
+BALANCE = success({'psys_cid': 'BTC', 'currency': 'BTC', 'balance': '1.5', 'locked_balance': '0'})
+
+
+def test_retry_honors_retry_after():
+    responses = [
+        plisio.FakeTransport.response(error('busy'), 503, {'Retry-After': '0.01'}),
+        plisio.FakeTransport.response(error('slow down'), 429, {'Retry-After': '0.02'}),
+        plisio.FakeTransport.response(BALANCE),
+    ]
+    transport = plisio.FakeTransport(lambda method, url, params: responses.pop(0))
+    retry = plisio.RetryPolicy(max_attempts=3, base_delay=10)
+    client = plisio.PlisioClient('key', transport=transport, retry=retry)
+
+    assert client.get_balance(plisio.CryptoCurrency.BTC).balance == 1.5
+    assert len(transport.calls) == 3
+    assert retry.retries == 2
+    assert retry.backoff_time == pytest.approx(0.03)
+
+
+def test_retry_gives_up_with_the_last_error():
+    transport = plisio.FakeTransport(
+        lambda method, url, params: plisio.FakeTransport.response(error('busy'), 503, {'Retry-After': '0'})
+    )
+    client = plisio.PlisioClient('key', transport=transport, retry=plisio.RetryPolicy(max_attempts=2))
+
+    with pytest.raises(plisio.ServiceUnavailableError):
+        client.get_balance(plisio.CryptoCurrency.BTC)
+    assert len(transport.calls) == 2
+
+
+def test_retry_of_connection_errors():
+    attempts = []
+
+    def handler(method, url, params):
+        attempts.append(url)
+        if len(attempts) < 3:
+            raise ConnectionError()
+        return BALANCE
+
+    retry = plisio.RetryPolicy(max_attempts=3, base_delay=0.001)
+    client = plisio.PlisioClient('key', transport=plisio.FakeTransport(handler), retry=retry)
+
+    assert client.get_balance(plisio.CryptoCurrency.BTC).balance == 1.5
+    assert retry.retries == 2
+
+
+def test_withdraw_is_not_retried():
+    transport = plisio.FakeTransport(lambda method, url, params: (503, error('busy')))
+    client = plisio.PlisioClient('key', transport=transport, retry=plisio.RetryPolicy(max_attempts=3))
+
+    with pytest.raises(plisio.ServiceUnavailableError):
+        client.withdraw(plisio.CryptoCurrency.BTC, 'address', 1.0)
+    assert len(transport.calls) == 1
+
+
+def test_aio_retry_honors_retry_after():
+    responses = [
+        plisio.AioFakeTransport.response(error('busy'), 503, {'Retry-After': '0.01'}),
+        plisio.AioFakeTransport.response(BALANCE),
+    ]
+    transport = plisio.AioFakeTransport(lambda method, url, params: responses.pop(0))
+    retry = plisio.RetryPolicy(max_attempts=2, base_delay=10)
+    client = plisio.PlisioAioClient('key', transport=transport, retry=retry)
+
+    assert run(client.get_balance(plisio.CryptoCurrency.BTC)).balance == 1.5
+    assert retry.backoff_time == pytest.approx(0.01)
@@ -0,0 +1,103 @@
+import asyncio
+import gc
+import warnings
+
+import pytest
+
+import plisio
+
+from .helpers import run
+
+
+def serve(handler):
+    """
+    Local aiohttp server on its own thread's loop; returns its url and a stop function
+    """
+    import threading
+    from aiohttp import web
+
+    loop = asyncio.new_event_loop()
+    app = web.Application()
+    app.router.add_get('/{tail:.*}', handler)
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    loop.run_until_complete(site.start())
+    port = site._server.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    def stop():
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    return f'http://127.0.0.1:{port}/', stop
+
+
+@pytest.fixture
+def server():
+    from aiohttp import web
+
+    async def handler(request):
+        if request.path == '/slow':
+            await asyncio.sleep(1)
+        return web.json_response({'status': 'success', 'data': {'psys_cid': 'BTC', 'balance': '1'}})
+
+    url, stop = serve(handler)
+    yield url
+    stop()
+
+
+def test_aiohttp_session_follows_the_event_loop(server, caplog):
+    transport = plisio.AiohttpTransport()
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        for _ in range(3):
+            assert run(transport.send('GET', server + 'balances/BTC', {})).status == 200
+        run(transport.close())
+        gc.collect()
+
+    unclosed = [str(w.message) for w in caught if 'Unclosed' in str(w.message)]
+    unclosed += [record.getMessage() for record in caplog.records if 'Unclosed' in record.getMessage()]
+    assert unclosed == []
+
+
+def test_aiohttp_timeout_is_a_transport_error(server):
+    transport = plisio.AiohttpTransport(timeout=0.05)
+
+    async def main():
+        try:
+            with pytest.raises(plisio.TransportError):
+                await transport.send('GET', server + 'slow', {})
+        finally:
+            await transport.close()
+
+    run(main())
+
+
+def test_requests_transport(server):
+    transport = plisio.RequestsTransport()
+    response = transport.send('GET', server + 'balances/BTC', {'api_key': 'key'})
+    transport.close()
+    assert response.status == 200
+    assert b'"balance"' in response.content
+
+
+def test_fake_transport_records_calls():
+    responses = [{'status': 'success', 'data': {}}, (404, {'status': 'error'})]
+    transport = plisio.FakeTransport(lambda method, url, params: responses.pop(0))
+
+    assert transport.send('GET', 'https://plisio.net/api/v1/a', {'page': 1}).status == 200
+    assert transport.send('GET', 'https://plisio.net/api/v1/b', {}).status == 404
+    assert transport.calls == [('GET', 'https://plisio.net/api/v1/a', {'page': 1}), ('GET', 'https://plisio.net/api/v1/b', {})]
+
+
+def test_fake_transport_connection_error_is_a_transport_error():
+    def refuse(method, url, params):
+        raise ConnectionError()
+
+    with pytest.raises(plisio.TransportError):
+        plisio.FakeTransport(refuse).send('GET', 'https://plisio.net/api/v1/a', {})
@@ -0,0 +1,105 @@
+import asyncio
+
+import plisio
+
+from .helpers import run
+from .test_callback import API_KEY, PAYLOADS, sign, tampered
+
+
+def deliver(receiver, *bodies):
+    """
+    POST the bodies to the receiver's app in turn; returns the response statuses
+    """
+    from aiohttp.test_utils import TestClient, TestServer
+
+    async def main():
+        client = TestClient(TestServer(receiver.app()))
+        await client.start_server()
+        try:
+            statuses = []
+            for body in bodies:
+                response = await client.post(receiver.path, data=body)
+                statuses.append(response.status)
+            return statuses
+        finally:
+            await client.close()
+
+    return run(main())
+
+
+def recording_receiver(**kwargs):
+    events = []
+
+    async def handler(event):
+        events.append(event)
+
+    return plisio.WebhookReceiver(API_KEY, handler, **kwargs), events
+
+
+def test_valid_callbacks_reach_the_handler():
+    receiver, events = recording_receiver()
+
+    assert deliver(receiver, sign(PAYLOADS[0]), sign(PAYLOADS[1])) == [200, 200]
+
+    assert [event.payload['txn_id'] for event in events] == ['64d1df01', '64d1df02']
+    assert isinstance(events[0].model, plisio.Invoice)
+    assert [event.status for event in events] == [plisio.OperationStatus.completed, plisio.OperationStatus.mismatch]
+    assert (receiver.received, receiver.processed, receiver.rejected) == (2, 2, 0)
+
+
+def test_invalid_callbacks_are_forbidden():
+    receiver, events = recording_receiver()
+
+    assert deliver(receiver, tampered(sign(PAYLOADS[0])), 'not json', sign(PAYLOADS[0], 'other-key')) == [403] * 3
+
+    assert events == []
+    assert receiver.rejected == 3
+
+
+def test_failed_handler_is_counted():
+    async def handler(event):
+        raise RuntimeError(event.payload['txn_id'])
+
+    receiver = plisio.WebhookReceiver(API_KEY, handler)
+
+    assert deliver(receiver, sign(PAYLOADS[0])) == [200]
+    assert (receiver.processed, receiver.failed) == (0, 1)
+
+
+def test_full_queue_asks_for_a_retry():
+    from aiohttp.test_utils import TestClient, TestServer
+
+    async def main():
+        release = asyncio.Event()
+
+        async def handler(event):
+            await release.wait()
+
+        receiver = plisio.WebhookReceiver(API_KEY, handler, workers=1, queue_size=1)
+        client = TestClient(TestServer(receiver.app()))
+        await client.start_server()
+        try:
+            statuses = []
+            for payload in PAYLOADS[:3]:
+                response = await client.post(receiver.path, data=sign(payload))
+                statuses.append(response.status)
+                await asyncio.sleep(0.01)
+            release.set()
+        finally:
+            await client.close()
+        return receiver, statuses
+
+    receiver, statuses = run(main())
+    assert statuses == [200, 200, 503]
+    assert (receiver.overflowed, receiver.processed) == (1, 2)
+
+
+def test_repeated_deliveries_are_handled_once(tmp_path):
+    deduplicator = plisio.CallbackDeduplicator(path=str(tmp_path / 'callbacks.db'))
+    receiver, events = recording_receiver(deduplicator=deduplicator)
+
+    assert deliver(receiver, sign(PAYLOADS[0]), sign(PAYLOADS[1]), sign(PAYLOADS[0])) == [200, 200, 200]
+
+    assert [event.payload['txn_id'] for event in events] == ['64d1df01', '64d1df02']
+    assert deduplicator.hits == 1
+    deduplicator.close()